@@ -0,0 +1,887 @@
+"""Configuration management for python-check-updates.
+
+This module provides a centralized configuration management system using Pydantic.
+It supports:
+- YAML-based configuration files
+- Environment variable overrides
+- Type validation and coercion
+- Nested configuration structures
+- Runtime configuration reloading
+- Singleton configuration pattern
+
+Example:
+    >>> from python_check_updates.config import config
+    >>> print(config.settings.app_name)
+    >>> config.reload()  # Reload configuration at runtime
+"""
+import hashlib
+import json
+import operator
+import os
+import pickle
+import sys
+import tempfile
+import time
+from enum import Enum
+from functools import cached_property, lru_cache
+from pathlib import Path
+from stat import S_ISDIR
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Final,
+    NamedTuple,
+    NotRequired,
+    Optional,
+    Tuple,
+    Type,
+    TypedDict,
+    TypeVar,
+    Union,
+    cast,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+import yaml
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+from pydantic_settings import BaseSettings
+from rich.style import Style
+
+from . import __version__
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional
+    from json import loads as _json_loads
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _Loader
+
+T = TypeVar('T')
+M = TypeVar('M', bound=BaseModel)
+
+
+SNAPSHOT_MAX_AGE: Final[float] = 7 * 24 * 60 * 60
+"""Seconds after which unused settings snapshots are pruned."""
+
+
+def _snapshot_dir() -> Optional[Path]:
+    """Get the per-user directory holding parsed config snapshots.
+
+    The directory must be a real directory owned by the current user and
+    closed to everyone else, since snapshots are unpickled from it.
+
+    Returns:
+        Path to the snapshot directory, or None if it cannot be used safely
+    """
+    directory = Path(tempfile.gettempdir()) / "python-check-updates"
+    try:
+        directory.mkdir(mode=0o700, exist_ok=True)
+        stat = os.lstat(directory)
+    except OSError:
+        return None
+    if not S_ISDIR(stat.st_mode) or stat.st_mode & 0o077:
+        return None
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        return None  # Never unpickle from a directory we don't own
+    _prune_snapshots(str(directory))
+    return directory
+
+
+@lru_cache(maxsize=None)
+def _prune_snapshots(directory: str) -> None:
+    """Remove snapshots not written for ``SNAPSHOT_MAX_AGE``, once per process.
+
+    Storing a snapshot only replaces older versions of the same config
+    file, so this is what clears out snapshots of deleted or moved files
+    and temporary files left behind by interrupted writes.
+    """
+    cutoff = time.time() - SNAPSHOT_MAX_AGE
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith("pcu-"):
+            continue
+        try:
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            continue
+
+
+class _FileKey(NamedTuple):
+    """Identity of one version of a file on disk."""
+    path: str
+    device: int
+    inode: int
+    mtime_ns: int
+    size: int
+
+
+def _file_key(path: str) -> _FileKey:
+    """Stat an already resolved file path once.
+
+    Callers resolve the path up front, so the key is independent of the
+    working directory and the same relative path in two directories never
+    shares cached settings, without re-resolving on every check.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    stat = os.stat(path)
+    return _FileKey(path, stat.st_dev, stat.st_ino,
+                    stat.st_mtime_ns, stat.st_size)
+
+
+class _ConfigKey(NamedTuple):
+    """Identity of one version of a config file and of its JSON sidecar."""
+    config: _FileKey
+    sidecar: Optional[_FileKey]
+
+
+def _sidecar_path(path: Union[str, Path]) -> Path:
+    """Path of the compiled JSON sidecar of a YAML config file."""
+    return Path(path).with_suffix(".json")
+
+
+def _config_key(path: str) -> _ConfigKey:
+    """Stat a resolved config file path and its sidecar, if any, once each.
+
+    Raises:
+        FileNotFoundError: If the config file does not exist
+    """
+    key = _file_key(path)
+    try:
+        sidecar = _file_key(str(_sidecar_path(path)))
+    except FileNotFoundError:
+        sidecar = None
+    return _ConfigKey(key, sidecar)
+
+
+@lru_cache(maxsize=1)
+def _schema_fingerprint() -> bytes:
+    """Digest of the settings schema that snapshots are validated against.
+
+    Editing a settings model changes the fingerprint, so snapshots written
+    by older code are not trusted even without a version bump.
+    """
+    schema = json.dumps(AppSettings.model_json_schema(), sort_keys=True)
+    return hashlib.blake2b(f"{__version__}:{schema}".encode(),
+                           digest_size=16).digest()
+
+
+def _snapshot_prefix(path: str) -> str:
+    """Snapshot file prefix shared by every version of one config file."""
+    digest = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    return f"pcu-{digest}-"
+
+
+def _source_digest(source: bytes) -> str:
+    """Digest of a YAML config file's content, recorded in its sidecar."""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+
+def _snapshot_id(path: str, source: bytes, sidecar: bytes = b"") -> bytes:
+    """Identify the validated settings of one config file's content.
+
+    Digests the schema fingerprint, the resolved path, the file's bytes and
+    its sidecar's bytes, so a snapshot only matches the exact content and
+    schema it was validated from, whatever the files' timestamps say.
+    """
+    digest = hashlib.blake2b()
+    for part in (_schema_fingerprint(), path.encode(), source, sidecar):
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.digest()
+
+
+def _snapshot_file(directory: Path, path: str, snapshot_id: bytes) -> Path:
+    """Name the snapshot file for a snapshot id."""
+    return directory / f"{_snapshot_prefix(path)}{snapshot_id[:16].hex()}.pkl"
+
+
+def _read_snapshot(cache_file: Path,
+                   snapshot_id: bytes) -> Optional[Dict[str, Any]]:
+    """Read a validated settings snapshot.
+
+    The snapshot starts with the full id it was written for, which is
+    compared before anything is unpickled; a file with any other id is
+    ignored rather than trusted.
+
+    Returns:
+        The snapshot's settings data, or None if there is no matching one
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            if f.read(len(snapshot_id)) != snapshot_id:
+                return None
+            data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _store_snapshot(cache_file: Path, path: str, snapshot_id: bytes,
+                    data: Dict[str, Any]) -> None:
+    """Atomically write a validated config snapshot and prune stale ones."""
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    prefix = _snapshot_prefix(path)
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(snapshot_id)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        for stale in cache_file.parent.glob(f"{prefix}*.pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _read_sidecar(source: bytes, sidecar: bytes) -> Optional[Dict[str, Any]]:
+    """Get the settings compiled into a sidecar from exactly this YAML.
+
+    Only a sidecar written by :func:`write_json_sidecar` is trusted: it must
+    record the digest of the YAML content it was compiled from. Anything
+    else, such as an unrelated ``config.json``, is ignored.
+    """
+    try:
+        payload = _json_loads(sidecar)
+    except ValueError:
+        return None
+    if (isinstance(payload, dict)
+            and payload.get("source") == _source_digest(source)
+            and isinstance(payload.get("settings"), dict)):
+        return payload["settings"]
+    return None
+
+
+def _parse_config(source: bytes, sidecar: bytes = b"") -> Dict[str, Any]:
+    """Parse a config file's content into a settings dictionary.
+
+    A JSON sidecar compiled from this exact YAML content is used instead of
+    parsing the YAML.
+
+    Args:
+        source: Content of the YAML config file
+        sidecar: Content of its JSON sidecar, if any
+    """
+    if sidecar:
+        data = _read_sidecar(source, sidecar)
+        if data is not None:
+            return data
+    return yaml.load(source, Loader=_Loader)
+
+
+def write_json_sidecar(config_path: Union[str, Path]) -> Path:
+    """Compile a YAML config file into a JSON sidecar that loads faster.
+
+    The sidecar is used only while the YAML content is unchanged.
+
+    Args:
+        config_path: Path to the YAML config file
+
+    Returns:
+        Path: Path of the written sidecar
+    """
+    source = Path(config_path).read_bytes()
+    payload = {"source": _source_digest(source),
+               "settings": yaml.load(source, Loader=_Loader)}
+    sidecar = _sidecar_path(config_path)
+    sidecar.write_text(json.dumps(payload, default=str), encoding="utf-8")
+    return sidecar
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Rebuild nested models inside a trusted value without validation."""
+    if not isinstance(value, dict):
+        return value
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _construct(annotation, value)
+    args = get_args(annotation)
+    if get_origin(annotation) is dict and len(args) == 2:
+        return {key: _construct_value(args[1], item)
+                for key, item in value.items()}
+    return value
+
+
+def _construct(model: Type[M], data: Dict[str, Any]) -> M:
+    """Recursively ``model_construct`` a model from trusted data.
+
+    ``model_construct`` does not recurse into nested models, so nested
+    dictionaries are rebuilt into their field's model type first.
+    """
+    values = {}
+    for name, value in data.items():
+        field = model.model_fields.get(name)
+        values[name] = value if field is None else _construct_value(
+            field.annotation, value)
+    return model.model_construct(**values)
+
+
+def _flatten_settings(value: Any,
+                      prefix: str = "",
+                      flat: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Flatten a settings tree into a dict keyed by dot-separated paths.
+
+    Every node is recorded, not just leaves, so ``"logging"`` maps to the
+    LoggingSettings model and ``"logging.console.enabled"`` to its flag.
+
+    Args:
+        value: Settings model, section dict, or leaf value
+        prefix: Dotted path of ``value`` including the trailing dot
+        flat: Mapping being filled in
+
+    Returns:
+        Mapping of interned dotted paths to setting values
+    """
+    if flat is None:
+        flat = {}
+    if isinstance(value, BaseModel):
+        items = ((name, getattr(value, name))
+                 for name in type(value).model_fields)
+    elif isinstance(value, dict):
+        items = value.items()
+    else:
+        return flat
+    for key, item in items:
+        path = sys.intern(f"{prefix}{key}")
+        flat[path] = item
+        _flatten_settings(item, f"{path}.", flat)
+    return flat
+
+
+@lru_cache(maxsize=512)
+def _attr_resolver(path: str) -> operator.attrgetter:
+    """Compile a dotted attribute path into a single C-level getter."""
+    return operator.attrgetter(path)
+
+
+# Logging config sections. They are defined here rather than in ``logging``,
+# which builds its sinks from the loaded settings, so neither module imports
+# the other at import time in both directions.
+class LogLevel(str, Enum):
+    TRACE = "TRACE"
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    SUCCESS = "SUCCESS"
+    WARNING = "WARNING"
+    ERROR = "ERROR"
+    CRITICAL = "CRITICAL"
+
+
+class ProgressStyle(NamedTuple):
+    """Styles for the parts of a progress bar.
+
+    Read on every progress bar build, so it is an immutable tuple with
+    plain attribute access rather than a model or dict.
+    """
+    bar_color: str
+    complete_style: Style
+    progress_style: Style
+    spinner_style: Style
+    description_style: Style = Style()
+
+    @classmethod
+    def from_config(cls, theme: "ThemeConfig") -> "ProgressStyle":
+        """Build a style from a validated theme config section."""
+        return cls(
+            bar_color=theme["bar_color"],
+            complete_style=Style(**theme["complete_style"]),
+            progress_style=Style(**theme["progress_style"]),
+            spinner_style=Style(**theme["spinner_style"]),
+            description_style=Style(**theme["description_style"]),
+        )
+
+
+# Leaf config sections are only read through their parent settings, so they
+# are TypedDicts: pydantic validates each as a single dict rather than a tree
+# of nested models.
+class StyleConfig(TypedDict):
+    color: str
+    bold: NotRequired[bool]
+
+
+class ThemeConfig(TypedDict):
+    bar_color: str
+    complete_style: StyleConfig
+    progress_style: StyleConfig
+    spinner_style: StyleConfig
+    description_style: StyleConfig
+
+
+class ProgressConfig(BaseModel):
+    theme: str = "NEON"
+    themes: Dict[str, ThemeConfig]
+
+    @cached_property
+    def resolved_themes(self) -> Dict[str, ProgressStyle]:
+        """Configured themes as rich styles, built once per settings load."""
+        return {
+            name: ProgressStyle.from_config(theme)
+            for name, theme in self.themes.items()
+        }
+
+
+class ConsoleConfig(TypedDict, total=False):
+    enabled: bool
+    show_time: bool
+    show_path: bool
+    rich_tracebacks: bool
+    traceback_extra_lines: int
+    traceback_theme: str
+
+
+class FileConfig(TypedDict, total=False):
+    enabled: bool
+    rotation_size: str
+    compression: str
+    retention_days: int
+    buffer_size: int
+
+
+class BatchConfig(TypedDict, total=False):
+    initial_size: int
+    max_size: int
+    min_size: int
+    check_interval: int
+    high_load_threshold: int
+    low_load_threshold: int
+
+
+CONSOLE_DEFAULTS: Final[ConsoleConfig] = {
+    "enabled": True,
+    "show_time": True,
+    "show_path": True,
+    "rich_tracebacks": True,
+    "traceback_extra_lines": 3,
+    "traceback_theme": "monokai",
+}
+
+FILE_DEFAULTS: Final[FileConfig] = {
+    "enabled": True,
+    "rotation_size": "100 MB",
+    "compression": "zip",
+    "retention_days": 7,
+    "buffer_size": 65536,
+}
+
+BATCH_DEFAULTS: Final[BatchConfig] = {
+    "initial_size": 100,
+    "max_size": 1000,
+    "min_size": 10,
+    "check_interval": 60,
+    "high_load_threshold": 80,
+    "low_load_threshold": 30,
+}
+
+# Defaults for each settings field holding a partial config section
+SECTION_DEFAULTS: Final[Dict[str, Dict[str, Any]]] = {
+    "console": CONSOLE_DEFAULTS,
+    "file": FILE_DEFAULTS,
+    "json": FILE_DEFAULTS,
+    "batch": BATCH_DEFAULTS,
+}
+
+
+DEFAULT_FORMAT: Final[str] = (
+    "<green>{time:YYYY-MM-DD at HH:mm:ss.SSS}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{module}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "PID: <cyan>{process}</cyan> | "
+    "TID: <cyan>{thread}</cyan> | "
+    "<level>{message}</level>")
+
+
+class FrozenModel(BaseModel):
+    """Base model that's immutable after creation."""
+
+    class Config:
+        frozen = True
+        validate_assignment = True
+        extra = "forbid"
+        validate_all = True
+
+
+class LoggingSettings(FrozenModel):
+    """Logging-specific configuration settings.
+    
+    Attributes:
+        app_name (str): Application name used in log files
+        level (LogLevel): Minimum logging level
+        log_dir (Path): Directory for log file storage
+        format_string (str): Log message format template
+        console (ConsoleConfig): Console output settings
+        file (FileConfig): File output settings
+        json (FileConfig): JSON output settings
+        batch (BatchConfig): Batch processing settings
+        progress (ProgressConfig): Progress bar settings
+        parallel (Dict[str, Any]): Parallel processing settings
+    """
+    app_name: str = "python-check-updates"
+    level: LogLevel = LogLevel.INFO
+    log_dir: Path = Path("logs")
+    format_string: str = DEFAULT_FORMAT
+    console: ConsoleConfig = CONSOLE_DEFAULTS
+    file: FileConfig = FILE_DEFAULTS
+    json: FileConfig = FILE_DEFAULTS
+    batch: BatchConfig = BATCH_DEFAULTS
+    progress: ProgressConfig
+    parallel: Dict[str, Any] = {"max_workers": 4}
+
+    @field_validator("console", "file", "json", "batch")
+    @classmethod
+    def _fill_section_defaults(cls, value: Dict[str, Any],
+                               info: ValidationInfo) -> Dict[str, Any]:
+        """Fill keys missing from a config section with their defaults."""
+        return {**SECTION_DEFAULTS[info.field_name], **value}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoggingSettings":
+        """Create validated settings instance."""
+        return cls(**data)
+
+
+class AppSettings(FrozenModel):
+    """Central application settings container.
+    
+    This class serves as the root configuration object, containing all
+    application settings in a hierarchical structure.
+    
+    Attributes:
+        app_name (str): Application name
+        version (str): Application version
+        debug (bool): Debug mode flag
+        logging (LoggingSettings): Logging configuration
+    """
+    # Application metadata
+    app_name: str = "python-check-updates"
+    version: str = "0.1.0"
+    debug: bool = False
+
+    # Logging configuration
+    logging: LoggingSettings
+
+    # Add other configuration sections as needed
+    # database: DatabaseSettings
+    # api: APISettings
+    # cache: CacheSettings
+    # etc.
+
+    class Config:
+        env_prefix = "APP_"
+        case_sensitive = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AppSettings":
+        """Create validated settings instance."""
+        return cls(**data)
+
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> "AppSettings":
+        """Create settings from already validated data, skipping validation.
+
+        Only use this with data produced by ``model_dump`` of a validated
+        instance, such as the on-disk config snapshot.
+        """
+        return _construct(cls, data)
+
+
+ENV_PREFIX = "APP_"
+ENV_NESTED_DELIMITER = "__"
+
+EnvSchema = Dict[str, Tuple[Tuple[str, ...], Callable[[str], Any]]]
+
+
+def _env_caster(annotation: Any) -> Callable[[str], Any]:
+    """Pick how a raw environment string is turned into a field value.
+
+    Scalars are passed through for pydantic to coerce during validation;
+    mappings are parsed as JSON.
+    """
+    if annotation is dict or get_origin(annotation) is dict \
+            or is_typeddict(annotation):
+        return _json_loads
+    return str
+
+
+def _build_env_schema(model: Type[BaseModel],
+                      prefix: str = ENV_PREFIX,
+                      path: Tuple[str, ...] = ()) -> EnvSchema:
+    """Map every overridable environment variable to its settings path.
+
+    Nested models and config sections are addressed with
+    ``ENV_NESTED_DELIMITER``, e.g. ``APP_LOGGING__CONSOLE__ENABLED``.
+
+    Args:
+        model: Settings model to walk
+        prefix: Environment variable prefix for this level
+        path: Settings path of ``model`` from the root
+
+    Returns:
+        EnvSchema: Variable name -> (settings path, value caster)
+    """
+    schema: EnvSchema = {}
+    for name, field in model.model_fields.items():
+        env_key = f"{prefix}{name.upper()}"
+        field_path = (*path, name)
+        annotation = field.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            schema.update(_build_env_schema(
+                annotation, env_key + ENV_NESTED_DELIMITER, field_path))
+            continue
+        # A whole section comes before its keys, so that when both are set
+        # the per-key overrides apply on top of the section's
+        schema[env_key] = (field_path, _env_caster(annotation))
+        if is_typeddict(annotation):
+            for key, key_type in get_type_hints(annotation).items():
+                schema[f"{env_key}{ENV_NESTED_DELIMITER}{key.upper()}"] = (
+                    (*field_path, key), _env_caster(key_type))
+    return schema
+
+
+_ENV_SCHEMA = _build_env_schema(AppSettings)
+
+
+def _apply_env_overrides(settings: AppSettings) -> AppSettings:
+    """Return settings with ``APP_*`` environment overrides applied.
+
+    Only the variables in ``_ENV_SCHEMA`` are looked up, so the cost does
+    not depend on the size of the environment. Overridden settings are
+    re-validated as a whole.
+
+    Raises:
+        ValueError: If a variable's value cannot be parsed, naming the
+            variable
+    """
+    environ = os.environ
+    overrides = []
+    for env_key, (path, cast_value) in _ENV_SCHEMA.items():
+        if env_key not in environ:
+            continue
+        try:
+            overrides.append((path, cast_value(environ[env_key])))
+        except ValueError as e:  # Includes JSON decode errors
+            raise ValueError(
+                f"Invalid value for environment variable {env_key}: {e}"
+            ) from e
+    if not overrides:
+        return settings
+
+    data = settings.model_dump()
+    for path, value in overrides:
+        node = data
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = value
+    return AppSettings.from_dict(data)
+
+
+class Config:
+    """Configuration management singleton.
+    
+    This class implements the singleton pattern for configuration management,
+    ensuring a single source of truth for application settings.
+    
+    Methods:
+        load_config: Load configuration from YAML file
+        reload: Reload configuration at runtime
+        settings: Access current settings
+    """
+    _instance: ClassVar[Optional["Config"]] = None
+    _lock: ClassVar[Lock] = Lock()
+    _initialized: bool = False
+    _settings: Optional[AppSettings] = None
+    _path: Path
+    _resolved_path: str
+    _flat_settings: Dict[str, Any] = {}
+    _loaded_key: Optional[_ConfigKey] = None
+
+    def __new__(cls) -> "Config":
+        """Ensure singleton instance.
+
+        Once created, the instance is returned after a single attribute load
+        and identity check; only the first construction takes the lock.
+        """
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
+
+    def __init__(self):
+        """Initialize with default config path on first construction only."""
+        if self._initialized:
+            return
+        with self._lock:
+            if self._initialized:
+                return
+            self._config_path = Path("config.yaml")
+            if self._settings is None:
+                self.load_config()
+            self._initialized = True
+
+    @property
+    def _config_path(self) -> Path:
+        """Config file to load, as given."""
+        return self._path
+
+    @_config_path.setter
+    def _config_path(self, path: Path) -> None:
+        # Resolve once here rather than on every reload, so checking the
+        # file for changes costs one stat of it and one of its sidecar
+        self._path = path
+        self._resolved_path = str(Path(path).resolve())
+
+    def get_setting(self, path: str, default: T = None) -> T:
+        """Get nested setting value.
+
+        Paths are resolved from the pre-flattened settings. A path reaching
+        past a leaf setting, such as ``"logging.log_dir.name"``, resolves the
+        remaining attributes on that leaf's value.
+        
+        Args:
+            path: Dot-separated path to setting
+            default: Default value if path not found
+            
+        Returns:
+            Setting value or default
+        """
+        flat = self._flat_settings
+        try:
+            return cast(T, flat[path])
+        except (KeyError, TypeError):
+            if not isinstance(path, str):
+                return default
+
+        prefix = path
+        while "." in prefix:
+            prefix = prefix.rpartition(".")[0]
+            if prefix in flat:
+                break
+        else:
+            return default
+        value = flat[prefix]
+        if isinstance(value, (BaseModel, dict)):
+            return default  # Fields of models and sections are all flattened
+        try:
+            return cast(T, _attr_resolver(path[len(prefix) + 1:])(value))
+        except AttributeError:
+            return default
+
+    def load_config(self, config_path: Optional[Path] = None,
+                    force: bool = False) -> None:
+        """Load configuration from YAML file with validation.
+
+        The file and its sidecar are stat'ed once each, by the path resolved
+        when it was set; their paths, inodes, mtimes and sizes decide
+        whether anything changed and key the settings cache.
+        Environment overrides are applied on top of the file's settings.
+
+        Args:
+            config_path: Config file to load instead of the current one
+            force: Re-apply environment overrides even if the file is
+                unchanged
+
+        Raises:
+            FileNotFoundError: If the config file does not exist
+        """
+        if config_path:
+            self._config_path = config_path
+
+        key = _config_key(self._resolved_path)
+        if key == self._loaded_key and not force:
+            return
+
+        settings = _apply_env_overrides(_load_settings(key))
+        self._loaded_key = key
+        # Settings are cached per file version, so a forced reload with no
+        # overrides hands back the same object and its flat view still holds
+        if settings is not self._settings:
+            self._settings = settings
+            self._flat_settings = _flatten_settings(settings)
+
+    @property
+    def settings(self) -> AppSettings:
+        """Get current application settings.
+        
+        Returns:
+            AppSettings: Validated configuration object
+        """
+        if self._settings is None:
+            self.load_config()
+        return self._settings
+
+    def reload(self) -> None:
+        """Reload configuration and environment overrides."""
+        self.load_config(force=True)
+
+
+@lru_cache(maxsize=4)
+def _load_settings(key: _ConfigKey) -> AppSettings:
+    """Load settings for one version of a config file.
+
+    The in-process cache is keyed on the identity of the file and its
+    sidecar, so each version is read and validated at most once per
+    process. Across processes, the on-disk snapshot of previously validated
+    settings, found by the file's content, lets new processes skip both
+    YAML parsing and validation.
+
+    Args:
+        key: Identity of the YAML config file and its sidecar
+
+    Returns:
+        AppSettings: Validated configuration object
+    """
+    path = key.config.path
+    source = Path(path).read_bytes()
+    try:
+        sidecar = b"" if key.sidecar is None else Path(
+            key.sidecar.path).read_bytes()
+    except FileNotFoundError:
+        sidecar = b""
+    snapshot_id = _snapshot_id(path, source, sidecar)
+    directory = _snapshot_dir()
+    cache_file = (None if directory is None
+                  else _snapshot_file(directory, path, snapshot_id))
+    if cache_file is not None:
+        data = _read_snapshot(cache_file, snapshot_id)
+        if data is not None:
+            return AppSettings.from_trusted_dict(data)
+
+    settings = AppSettings.from_dict(_parse_config(source, sidecar))
+    if cache_file is not None:
+        _store_snapshot(cache_file, path, snapshot_id,
+                        settings.model_dump())
+    return settings
+
+
+def load_settings(config_path: Union[str, Path]) -> AppSettings:
+    """Load settings from a config file, cached per version of the file.
+
+    A version is identified by the file's resolved path and stat plus those
+    of its JSON sidecar, so the same relative path in another directory or
+    an edited sidecar never reuses cached settings.
+
+    Args:
+        config_path: Path to the YAML config file
+
+    Returns:
+        AppSettings: Validated configuration object
+    """
+    return _load_settings(_config_key(str(Path(config_path).resolve())))
+
+
+# Initialize singleton configuration
+config = Config()
@@ -0,0 +1,1013 @@
+"""python_check_updates/logging.py
+
+Enhanced logging configuration using Loguru + Rich.
+
+This module provides a robust logging system with:
+- Multiple output formats (console, file, JSON)
+- Progress bars with themes
+- Performance tracking
+- Batch logging
+- Async logging support
+- Statistics collection
+- Thread-safe operations
+
+The logging system is configured via YAML and integrates with the
+application's central configuration management.
+
+JSON records are serialized with orjson when it is installed, falling back
+to the standard library ``json`` module otherwise.
+"""
+import atexit
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import zipfile
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import lru_cache, partial
+from pathlib import Path
+from threading import Lock, Thread
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Tuple,
+    Type,
+    Union,
+)
+
+import psutil
+
+try:
+    import orjson
+except ImportError:  # Optional, JSON sink falls back to the stdlib
+    orjson = None
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+from loguru import logger
+from rich.console import Console
+from rich.logging import RichHandler
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.style import Style
+from rich.theme import Theme
+from rich.traceback import Traceback
+
+from .config import (
+    BATCH_DEFAULTS,
+    DEFAULT_FORMAT,
+    FILE_DEFAULTS,
+    BatchConfig,
+    FileConfig,
+    LogLevel,
+    LoggingSettings,
+    ProgressStyle,
+    config,
+    load_settings,
+)
+
+
+# Loguru severity number of each level, resolved once at import. Keyed by
+# the members themselves so lookups with a LogLevel hit on identity, while
+# plain level names still match by value.
+_LEVELNO: Final[Dict[str, int]] = {
+    lvl: logger.level(lvl.value).no
+    for lvl in LogLevel
+}
+
+# Position of each level in LogStats.messages_by_level
+_LEVEL_IDX: Final[Dict[str, int]] = {
+    lvl: i for i, lvl in enumerate(LogLevel)
+}
+
+
+@lru_cache(maxsize=None)
+def _as_level(level: str) -> LogLevel:
+    """Resolve a level name to its LogLevel member, once per distinct name.
+
+    Raises:
+        ValueError: If ``level`` is not a LogLevel name
+    """
+    return LogLevel(level)
+
+
+class ProgressReporter(NamedTuple):
+    """Callbacks handed out by ``LoggingConfig.progress_context``.
+
+    Attributes:
+        update: Advance the task, by one step unless given a count
+        finish: Remove the task from its progress bar; safe to call twice
+    """
+    update: Callable[..., None]
+    finish: Callable[[], None]
+
+
+class ProgressBarStyle:
+    """Custom progress bar styling configurations."""
+    DEFAULT = ProgressStyle(
+        bar_color="cyan",
+        complete_style=Style(color="green"),
+        progress_style=Style(color="cyan"),
+        spinner_style=Style(color="yellow"),
+    )
+
+    RAINBOW = ProgressStyle(
+        bar_color="magenta",
+        complete_style=Style(color="green", bold=True),
+        progress_style=Style(color="bright_magenta"),
+        spinner_style=Style(color="cyan", bold=True),
+    )
+
+
+class ProgressTheme:
+    """Custom progress bar themes."""
+    NEON = ProgressStyle(
+        bar_color="bright_cyan",
+        complete_style=Style(color="bright_green", bold=True),
+        progress_style=Style(color="bright_white"),
+        spinner_style=Style(color="bright_magenta"),
+        description_style=Style(color="bright_yellow"),
+    )
+
+    MINIMAL = ProgressStyle(
+        bar_color="white",
+        complete_style=Style(color="grey70"),
+        progress_style=Style(color="grey50"),
+        spinner_style=Style(color="grey85"),
+        description_style=Style(color="grey74"),
+    )
+
+
+@dataclass
+class LogStats:
+    """Log statistics tracking.
+
+    Per-level counts are kept in a list indexed by LogLevel position, so an
+    update is a few increments. They are not atomic, and ``alog`` and
+    batch flushes update from different threads, so updates hold a lock;
+    batched messages take it once per level group, not per message.
+    """
+    total_messages: int = 0
+    messages_by_level: List[int] = field(
+        default_factory=lambda: [0] * len(LogLevel))
+    errors_count: int = 0
+    start_time: float = field(default_factory=time.monotonic)
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def update(self, level: LogLevel, is_error: bool = False, count: int = 1):
+        """Record ``count`` messages logged at ``level``.
+
+        Callers should pass LogLevel members, which match the index keys by
+        identity; level names still work.
+        """
+        idx = _LEVEL_IDX.get(level)
+        with self._lock:
+            if idx is not None:
+                self.messages_by_level[idx] += count
+            self.total_messages += count
+            if is_error:
+                self.errors_count += count
+
+    def by_level(self) -> Dict[str, int]:
+        """Get message counts keyed by level name, for levels seen."""
+        return {
+            lvl.value: count
+            for lvl, count in zip(LogLevel, self.messages_by_level) if count
+        }
+
+
+def _group_by_level(
+        records: Iterable[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Group (level, message) records by level, preserving message order."""
+    grouped: Dict[str, List[str]] = defaultdict(list)
+    for level, message in records:
+        grouped[level].append(message)
+    return grouped
+
+
+class _ExecutorHolder:
+    """Holder for the thread pool shared by all LoggingConfig instances."""
+    executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    lock: ClassVar[Lock] = Lock()
+
+
+def get_executor(max_workers: int = 4) -> ThreadPoolExecutor:
+    """Get the shared logging thread pool, creating it on first use.
+
+    Args:
+        max_workers: Pool size, only used by the call that creates the pool
+
+    Returns:
+        ThreadPoolExecutor: Process-wide logging executor
+    """
+    executor = _ExecutorHolder.executor
+    if executor is None:
+        with _ExecutorHolder.lock:
+            executor = _ExecutorHolder.executor
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers)
+                atexit.register(executor.shutdown)
+                _ExecutorHolder.executor = executor
+    return executor
+
+
+class _CpuSampler:
+    """Last system CPU load sample, shared by all LoggingConfig instances."""
+    load: ClassVar[float] = 0.0
+    samples: ClassVar[int] = 0
+    thread: ClassVar[Optional[Thread]] = None
+    lock: ClassVar[Lock] = Lock()
+
+
+def _sample_cpu(interval: float) -> None:
+    """Sample system CPU load every interval; runs on the sampler thread."""
+    while True:
+        _CpuSampler.load = psutil.cpu_percent(interval=interval)
+        _CpuSampler.samples += 1
+
+
+def start_cpu_sampler(interval: float) -> None:
+    """Start the process-wide CPU load sampler if it isn't running yet.
+
+    A single daemon thread samples for every instance, so the blocking
+    ``psutil`` call never happens on a logging call and no instance is kept
+    alive by a thread of its own.
+
+    Args:
+        interval: Seconds per sample, only used by the call that starts it
+    """
+    if _CpuSampler.thread is None:
+        with _CpuSampler.lock:
+            if _CpuSampler.thread is None:
+                thread = Thread(target=_sample_cpu, args=(interval,),
+                                name="log-cpu-sampler", daemon=True)
+                thread.start()
+                _CpuSampler.thread = thread
+
+
+# ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+_MAXRSS_BYTES: Final[int] = 1 if sys.platform == "darwin" else 1024
+
+
+@lru_cache(maxsize=1)
+def _process(pid: int) -> psutil.Process:
+    """Get the psutil handle for ``pid``, created once per process.
+
+    Keyed on the pid so a forked child gets its own handle instead of
+    reporting on its parent.
+    """
+    return psutil.Process(pid)
+
+
+# Pre-interned JSON record keys
+_K_TIMESTAMP: Final[str] = sys.intern("timestamp")
+_K_LEVEL: Final[str] = sys.intern("level")
+_K_MESSAGE: Final[str] = sys.intern("message")
+_K_MODULE: Final[str] = sys.intern("module")
+_K_FUNCTION: Final[str] = sys.intern("function")
+_K_LINE: Final[str] = sys.intern("line")
+_K_PROCESS: Final[str] = sys.intern("process")
+_K_THREAD: Final[str] = sys.intern("thread")
+_K_EXTRA: Final[str] = sys.intern("extra")
+# Extra key carrying the messages of a raw batch payload to the JSON sink
+_K_BATCH: Final[str] = sys.intern("batch")
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib encoder can't, matching orjson's output.
+
+    The outputs only match for plain datetimes, as :func:`_json_record`
+    produces: orjson hands datetime subclasses to ``str`` instead.
+    """
+    if isinstance(value, datetime):
+        if value.utcoffset() in (None, timedelta(0)):
+            return value.replace(tzinfo=None).isoformat() + "Z"
+        return value.isoformat()
+    return str(value)
+
+
+def _stdlib_dumps(record: Dict[str, Any]) -> bytes:
+    """Serialize a record to one line of JSON with the stdlib encoder."""
+    return json.dumps(record, default=_json_default, ensure_ascii=False,
+                      separators=(",", ":")).encode() + b"\n"
+
+
+if orjson is not None:
+    # orjson formats datetimes natively; naive times are treated as UTC
+    _dumps_record: Callable[[Dict[str, Any]], bytes] = partial(
+        orjson.dumps,
+        default=str,
+        option=(orjson.OPT_APPEND_NEWLINE | orjson.OPT_NAIVE_UTC
+                | orjson.OPT_UTC_Z),
+    )
+else:
+    _dumps_record = _stdlib_dumps
+
+
+def _json_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Select the fields of a loguru record written to the JSON log."""
+    time = record["time"]
+    return {
+        # loguru's time is a datetime subclass, which orjson only serializes
+        # through ``default``; a plain datetime gets its ISO 8601 format
+        _K_TIMESTAMP: datetime.combine(time.date(), time.timetz()),
+        _K_LEVEL: record["level"].name,
+        _K_MESSAGE: record["message"],
+        _K_MODULE: record["module"],
+        _K_FUNCTION: record["function"],
+        _K_LINE: record["line"],
+        _K_PROCESS: record["process"].id,
+        _K_THREAD: record["thread"].id,
+        _K_EXTRA: record["extra"],
+    }
+
+
+_SIZE_UNITS: Final[Dict[str, int]] = {
+    "": 1, "b": 1,
+    "kb": 1000, "mb": 1000 ** 2, "gb": 1000 ** 3,
+    "kib": 1024, "mib": 1024 ** 2, "gib": 1024 ** 3,
+}
+
+
+def _parse_size(size: str) -> int:
+    """Parse a size such as ``"100 MB"`` into bytes, as loguru does.
+
+    Raises:
+        ValueError: If the size or its unit is invalid
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d*)?)\s*([a-zA-Z]*)\s*", size)
+    unit = match and _SIZE_UNITS.get(match[2].lower())
+    if unit is None:
+        raise ValueError(f"Invalid size: {size!r}")
+    return int(float(match[1]) * unit)
+
+
+class BufferedFileSink:
+    """Loguru sink appending formatted records to a file through a buffer.
+
+    Like loguru's file sink, the file can be rotated once it would grow past
+    ``rotation_size``: it is renamed with a timestamp, optionally compressed,
+    and rotated files older than ``retention_days`` are deleted.
+
+    The sink deliberately has no ``flush`` method: loguru flushes streams
+    that have one after every message, which would defeat the write buffer.
+    Buffered records are written out when the buffer fills, on
+    :meth:`sync` and when loguru stops the sink.
+
+    Attributes:
+        path (Path): Destination log file
+    """
+
+    COMPRESSIONS: Final[Tuple[str, ...]] = ("zip", "gz")
+
+    def __init__(self, path: Union[str, Path], buffering: int = -1,
+                 rotation_size: Optional[str] = None,
+                 compression: Optional[str] = None,
+                 retention_days: Optional[int] = None):
+        if compression is not None and compression not in self.COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression!r}")
+        self.path = Path(path)
+        self._buffering = buffering
+        self._max_size = (None if rotation_size is None
+                          else _parse_size(rotation_size))
+        self._compression = compression
+        self._retention = (None if retention_days is None
+                           else timedelta(days=retention_days).total_seconds())
+        # Writes come from loguru's queue thread, syncs from the caller's
+        self._lock = Lock()
+        self._open()
+
+    def _open(self) -> None:
+        """Open the log file for appending and note its current size."""
+        self._file = open(self.path, "ab", buffering=self._buffering)
+        self._size = self._file.tell()
+
+    def _encode(self, message: Any) -> bytes:
+        """Encode a loguru message as the bytes to append."""
+        return message.encode()
+
+    def write(self, message: Any) -> None:
+        """Append a loguru message, rotating the file first if it is full."""
+        line = self._encode(message)
+        with self._lock:
+            if (self._max_size is not None and self._size
+                    and self._size + len(line) > self._max_size):
+                self._rotate()
+            self._file.write(line)
+            self._size += len(line)
+
+    def sync(self) -> None:
+        """Write buffered records out to the file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def _rotate(self) -> None:
+        """Move the full file aside, compress it and prune expired ones."""
+        self._file.close()
+        stamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+        path = self.path
+        rotated = path.with_name(f"{path.stem}.{stamp}{path.suffix}")
+        os.replace(path, rotated)
+
+        if self._compression == "zip":
+            with zipfile.ZipFile(f"{rotated}.zip", "w",
+                                 zipfile.ZIP_DEFLATED) as archive:
+                archive.write(rotated, rotated.name)
+            rotated.unlink()
+        elif self._compression == "gz":
+            with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz",
+                                                       "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+
+        if self._retention is not None:
+            cutoff = time.time() - self._retention
+            for old in path.parent.glob(f"{path.stem}.*{path.suffix}*"):
+                if old.stat().st_mtime < cutoff:
+                    old.unlink(missing_ok=True)
+        self._open()
+
+    def stop(self) -> None:
+        """Close the underlying file when loguru removes the sink."""
+        with self._lock:
+            self._file.close()
+
+
+class JsonSink(BufferedFileSink):
+    """Loguru sink writing each record as one line of JSON.
+
+    Records are serialized straight to bytes (by orjson when available),
+    skipping loguru's text formatting and a UTF-8 encode per message.
+
+    A raw payload emitted by :meth:`LoggingConfig.batch_log` is split back
+    into one line per batched message. The batched messages were logged
+    together, so their lines share the flush's timestamp, process and
+    thread, and carry no module, function or line.
+    """
+
+    def _encode(self, message: Any) -> bytes:
+        """Serialize the record, or each batched message, of a message."""
+        record = message.record
+        data = _json_record(record)
+        extra = data[_K_EXTRA]
+        if _K_BATCH not in extra:
+            return _dumps_record(data)
+        data[_K_EXTRA] = {k: v for k, v in extra.items() if k != _K_BATCH}
+        data[_K_MODULE] = data[_K_FUNCTION] = data[_K_LINE] = None
+        lines = []
+        for batched in extra[_K_BATCH]:
+            data[_K_MESSAGE] = batched
+            lines.append(_dumps_record(data))
+        return b"".join(lines)
+
+
+class LoggingConfig:
+    """Advanced logging configuration and management.
+    
+    This class handles all aspects of logging configuration and provides
+    high-level logging utilities. It supports multiple output formats,
+    progress tracking, and performance monitoring.
+    
+    Attributes:
+        app_name (str): Application identifier
+        log_level (LogLevel): Minimum logging level
+        log_dir (Path): Log file directory
+        format_string (str): Log message format
+        console (Console): Rich console instance
+        progress (Progress): Progress bar manager
+        stats (LogStats): Logging statistics
+    """
+    DEFAULT_FORMAT: Final[str] = DEFAULT_FORMAT
+    MAX_BATCH_SIZE: Final[int] = 10000
+    PROGRESS_CACHE_SIZE: Final[int] = 100
+
+    def __init__(
+        self,
+        app_name: str,
+        log_level: Union[str, LogLevel] = LogLevel.INFO,
+        log_dir: Union[str, Path] = "logs",
+        format_string: Optional[str] = None,
+        enable_console: bool = True,
+        enable_file: bool = True,
+        enable_json: bool = True,
+        batch_size: int = 100,
+        progress_style: ProgressStyle = ProgressBarStyle.DEFAULT,
+        max_workers: int = 4,
+        batch: Optional[BatchConfig] = None,
+        file: Optional[FileConfig] = None,
+        json_file: Optional[FileConfig] = None,
+        themes: Optional[Dict[str, ProgressStyle]] = None,
+    ):
+        self.app_name = app_name
+        self.log_level = LogLevel(log_level)
+        self.log_dir = Path(log_dir)
+        self.format_string = format_string or self.DEFAULT_FORMAT
+        self.enable_console = enable_console
+        self.enable_file = enable_file
+        self.enable_json = enable_json
+        self.console = Console()
+        self.batch_size = batch_size
+        self.progress_style = progress_style
+        self.themes = themes or {}
+        self._log_batch: Deque[Tuple[LogLevel, str]] = deque()
+        self.stats = LogStats()
+        self.executor = get_executor(max_workers)
+        self._adaptive_batch_size = batch_size
+        self._batch_settings: BatchConfig = {**BATCH_DEFAULTS, **(batch or {})}
+        self._file_settings: FileConfig = {**FILE_DEFAULTS, **(file or {})}
+        self._json_settings: FileConfig = {
+            **FILE_DEFAULTS, **(json_file or {})}
+        self._cpu_samples_seen = 0
+        self._flush_lock = Lock()
+        self._progress_lock = Lock()
+        self._progress_cache: Dict[str, Progress] = {}
+        self._file_sinks: List[BufferedFileSink] = []
+        self._level_override: ContextVar[Optional[int]] = ContextVar(
+            "level_override", default=None)
+
+        # Initialize custom progress bar
+        self.progress = Progress(
+            SpinnerColumn(style=self.progress_style.spinner_style),
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(complete_style=self.progress_style.complete_style,
+                      finished_style=self.progress_style.complete_style),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            console=self.console,
+        )
+
+        self.reconfigure_sinks()
+        start_cpu_sampler(self._batch_settings["check_interval"])
+
+    @classmethod
+    def from_yaml(cls, config_path: Union[str, Path]) -> "LoggingConfig":
+        """Create LoggingConfig from YAML file.
+
+        The file goes through the application's cached settings loader, so
+        each version of it is parsed and validated at most once.
+        """
+        return cls.from_settings(load_settings(config_path).logging)
+
+    @classmethod
+    def from_settings(
+            cls,
+            settings: Optional[LoggingSettings] = None) -> "LoggingConfig":
+        """Create LoggingConfig from application settings.
+
+        Args:
+            settings: Logging settings, defaults to the loaded app config's
+        """
+        if settings is None:
+            settings = config.settings.logging
+        themes = settings.progress.resolved_themes
+        return cls(
+            app_name=settings.app_name,
+            log_level=settings.level,
+            log_dir=settings.log_dir,
+            format_string=settings.format_string,
+            enable_console=settings.console["enabled"],
+            enable_file=settings.file["enabled"],
+            enable_json=settings.json["enabled"],
+            batch_size=settings.batch["initial_size"],
+            progress_style=themes[settings.progress.theme.lower()],
+            max_workers=settings.parallel["max_workers"],
+            batch=settings.batch,
+            file=settings.file,
+            json_file=settings.json,
+            themes=themes,
+        )
+
+    def reconfigure_sinks(self) -> None:
+        """Replace all loguru sinks with the ones this config enables.
+
+        Called on construction; call again to re-apply sink settings without
+        re-importing the module.
+        """
+        # Create log directory if it doesn't exist
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+
+        # Remove default logger
+        logger.remove()
+        self._file_sinks = []
+        sink_levels = []
+
+        if self.enable_console:
+            self._setup_console_logging()
+            sink_levels.append(_LEVELNO[self.log_level.value])
+
+        if self.enable_file:
+            self._setup_file_logging()
+            sink_levels.append(_LEVELNO[LogLevel.DEBUG.value])
+
+        if self.enable_json:
+            self._setup_json_logging()
+            sink_levels.append(_LEVELNO[LogLevel.DEBUG.value])
+
+        # Lowest severity any sink accepts; batches below it are not emitted
+        self._min_levelno = min(sink_levels, default=sys.maxsize)
+
+    def _setup_console_logging(self) -> None:
+        """Configure console logging."""
+        logger.add(
+            sink=RichHandler(
+                console=self.console,
+                show_time=True,
+                show_path=True,
+                rich_tracebacks=True,
+                tracebacks_extra_lines=3,
+                tracebacks_theme="monokai",
+            ),
+            level=self.log_level.value,
+            format=self.format_string,
+            colorize=True,
+            backtrace=True,
+            diagnose=True,
+            filter=self._log_filter,
+        )
+
+    def _add_file_sink(self, sink_type: Type[BufferedFileSink], suffix: str,
+                       settings: FileConfig) -> BufferedFileSink:
+        """Create a buffered file sink that ``flush_logs`` will sync."""
+        sink = sink_type(self.log_dir / f"{self.app_name}{suffix}",
+                         buffering=settings["buffer_size"],
+                         rotation_size=settings["rotation_size"],
+                         compression=settings["compression"],
+                         retention_days=settings["retention_days"])
+        self._file_sinks.append(sink)
+        return sink
+
+    def _setup_file_logging(self) -> None:
+        """Configure file logging."""
+        logger.add(
+            sink=self._add_file_sink(BufferedFileSink, ".log",
+                                     self._file_settings),
+            level=LogLevel.DEBUG.value,
+            format=self.format_string,
+            backtrace=True,
+            diagnose=True,
+            enqueue=True,
+            filter=self._log_filter,
+        )
+
+    def _setup_json_logging(self) -> None:
+        """Configure JSON structured logging."""
+        logger.add(
+            sink=self._add_file_sink(JsonSink, ".json", self._json_settings),
+            level=LogLevel.DEBUG.value,
+            format="{message}",
+            enqueue=True,
+            filter=self._log_filter,
+        )
+
+    def _log_filter(self, record: Dict[str, Any]) -> bool:
+        """Custom log filter.
+
+        Drops records below the level set by ``temporary_level`` in the
+        current context, if any.
+        """
+        override = self._level_override.get()
+        return override is None or record["level"].no >= override
+
+    def _adjust_batch_size(self):
+        """Dynamically adjust batch size based on system load.
+        
+        This method implements adaptive batch sizing by:
+        1. Reading the last sampled system CPU usage, once per sample
+        2. Reducing batch size under high load
+        3. Increasing batch size under low load
+        4. Staying within configured min/max limits
+        """
+        samples = _CpuSampler.samples
+        if samples == self._cpu_samples_seen:
+            return
+        self._cpu_samples_seen = samples
+        settings = self._batch_settings
+        system_load = _CpuSampler.load
+        if system_load > settings["high_load_threshold"]:
+            self._adaptive_batch_size = max(settings["min_size"],
+                                            self._adaptive_batch_size // 2)
+        elif system_load < settings["low_load_threshold"]:
+            self._adaptive_batch_size = min(settings["max_size"],
+                                            self._adaptive_batch_size * 2)
+
+    @contextmanager
+    def temporary_level(self, level: Union[str, LogLevel]):
+        """Temporarily raise the minimum log level in the current context.
+
+        The override is held in a context variable checked by the sink
+        filter, so it applies to the current thread or task only and cannot
+        lower a sink's own level.
+        """
+        token = self._level_override.set(_LEVELNO[LogLevel(level).value])
+        try:
+            yield
+        finally:
+            self._level_override.reset(token)
+
+    def create_progress_bar(self,
+                            total: int,
+                            description: str = "Processing",
+                            transient: bool = True) -> Progress:
+        """Create a custom progress bar."""
+        return self.progress.add_task(description,
+                                      total=total,
+                                      transient=transient)
+
+    def update_progress(self, task_id: int, advance: int = 1):
+        """Update progress bar."""
+        self.progress.update(task_id, advance=advance)
+
+    @contextmanager
+    def progress_context(
+            self,
+            total: int,
+            description: str = "Processing") -> Iterator[ProgressReporter]:
+        """Memory-efficient progress tracking.
+
+        The cached bar for a description is reused unless it is already
+        running; a nested or concurrent context with the same description
+        gets a bar of its own, so exiting it leaves the outer display alone.
+        """
+        with self._progress_lock:
+            progress = self._get_progress(description)
+            if progress.live.is_started:
+                progress = self.create_themed_progress()
+            progress.start()
+
+        def finish() -> None:
+            if task in progress.task_ids:
+                progress.remove_task(task)
+
+        try:
+            task = progress.add_task(description, total=total)
+            try:
+                yield ProgressReporter(
+                    update=lambda x=1: progress.update(task, advance=x),
+                    finish=finish)
+            finally:
+                finish()
+        finally:
+            progress.stop()
+
+    def _get_progress(self, description: str) -> Progress:
+        """Get a reusable themed progress bar for a description.
+
+        Bars are cached on the instance, so they are released with it; once
+        ``PROGRESS_CACHE_SIZE`` descriptions are cached the oldest is dropped.
+        """
+        progress = self._progress_cache.get(description)
+        if progress is None:
+            if len(self._progress_cache) >= self.PROGRESS_CACHE_SIZE:
+                del self._progress_cache[next(iter(self._progress_cache))]
+            progress = self._progress_cache[description] = (
+                self.create_themed_progress())
+        return progress
+
+    @contextmanager
+    def performance_tracking(self, operation_name: str):
+        """Track performance metrics for an operation."""
+        start_time = time.perf_counter()
+        start_memory = self._peak_rss()
+
+        try:
+            yield
+        finally:
+            end_time = time.perf_counter()
+            end_memory = self._peak_rss()
+            duration = end_time - start_time
+            memory_used = (end_memory - start_memory) / 1024 / 1024  # MB
+
+            logger.info(f"Performance metrics for {operation_name}:\n"
+                        f"Duration: {duration:.2f}s\n"
+                        f"Peak memory growth: {memory_used:.2f}MB")
+
+    def _peak_rss(self) -> int:
+        """Get the process's peak resident set size in bytes.
+
+        Uses a single ``getrusage`` syscall where available, falling back to
+        the process's cached ``psutil`` handle.
+        """
+        if resource is None:
+            return _process(os.getpid()).memory_info().rss
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_BYTES
+
+    def batch_log(self, level: str, message: str):
+        """Thread-safe batch logging without locking producers.
+
+        ``deque.append`` is atomic, so callers never wait on a lock. Once the
+        batch is full, whichever caller wins the flush lock drains it while
+        the others keep appending.
+        """
+        self._log_batch.append((_as_level(level), message))
+
+        if len(self._log_batch) >= self._adaptive_batch_size:
+            if self._flush_lock.acquire(blocking=False):
+                try:
+                    self._drain_batch()
+                finally:
+                    self._flush_lock.release()
+
+    def flush_logs(self):
+        """Flush batched logs.
+
+        File and JSON sinks are written from loguru's queue thread, so this
+        also waits for every queued record to reach its sink, then writes
+        the sinks' buffers out to disk.
+        """
+        with self._flush_lock:
+            self._drain_batch()
+        logger.complete()
+        for sink in self._file_sinks:
+            sink.sync()
+
+    def _drain_batch(self) -> None:
+        """Emit and remove batched logs; caller must hold the flush lock.
+
+        Only the records present on entry are taken, so producers that keep
+        appending cannot hold the flusher in the loop. The deque is drained
+        with ``popleft`` rather than swapped out: a producer may already hold
+        a reference to the old deque, and its append would be lost.
+        """
+        self._adjust_batch_size()
+        batch = self._log_batch
+        popleft = batch.popleft
+        records = [popleft() for _ in range(len(batch))]
+        if records:
+            self._emit_grouped(_group_by_level(records))
+
+    def _emit_grouped(self, grouped: Dict[LogLevel, List[str]]) -> None:
+        """Emit grouped messages as a single raw payload per level.
+
+        Raw output bypasses loguru's per-record formatting, so each sink is
+        dispatched once per level instead of once per message. Text sinks
+        get the messages as bare lines; the messages also travel in the
+        record's extra so the JSON sink can write one line per message.
+        Either way the caller's module, function and line are not recorded.
+        """
+        for level, messages in grouped.items():
+            # Skip joining and dispatching batches no sink would accept
+            if _LEVELNO[level] >= self._min_levelno:
+                logger.opt(raw=True).bind(**{_K_BATCH: messages}).log(
+                    level, "\n".join(messages) + "\n")
+            self.stats.update(level, count=len(messages))
+
+    async def async_log(self, level: str, message: str):
+        """Async logging support."""
+        await logger.complete()
+        logger.log(level, message)
+
+    def interpolate(self, message: str, **kwargs) -> str:
+        """Helper for log message interpolation."""
+        try:
+            return message.format(**kwargs)
+        except KeyError as e:
+            return f"Failed to interpolate log message: {message} with args: {kwargs}. Error: {e}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current logging statistics."""
+        duration = time.monotonic() - self.stats.start_time
+        return {
+            "total_messages": self.stats.total_messages,
+            "messages_per_second": self.stats.total_messages / duration,
+            "messages_by_level": self.stats.by_level(),
+            "errors_count": self.stats.errors_count,
+            "uptime_seconds": duration,
+        }
+
+    @contextmanager
+    def exception_group(self, group_name: str):
+        """Context manager for grouped exception handling."""
+        try:
+            yield
+        except Exception as e:
+            tb = Traceback.from_exception(
+                exc_type=type(e),
+                exc_value=e,
+                traceback=e.__traceback__,
+                show_locals=True,
+                theme="monokai",
+            )
+            self.console.print(f"\n[red]Error in {group_name}:[/red]")
+            self.console.print(tb)
+            raise
+
+    def create_themed_progress(self,
+                               theme: Union[str, ProgressStyle] = ProgressTheme.NEON,
+                               **kwargs) -> Progress:
+        """Create a progress bar with custom theme.
+
+        Args:
+            theme: Style to use, or the name of a configured theme
+        """
+        if isinstance(theme, str):
+            theme = self.themes[theme.lower()]
+        return Progress(
+            SpinnerColumn(style=theme.spinner_style),
+            TextColumn(
+                "[{task.description}]",
+                style=theme.description_style,
+            ),
+            BarColumn(
+                complete_style=theme.complete_style,
+                finished_style=theme.complete_style,
+                pulse_style=theme.progress_style,
+            ),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            console=self.console,
+            **kwargs,
+        )
+
+    def parallel_log(self,
+                     messages: List[Tuple[str, str]],
+                     chunk_size: int = 1000):
+        """Optimized parallel logging with chunking."""
+
+        def process_chunk(grouped: Dict[LogLevel, List[str]]) -> None:
+            with self._flush_lock:
+                self._emit_grouped(grouped)
+
+        # Process in chunks for better memory usage, grouping each chunk
+        # before submission so workers only emit
+        for i in range(0, len(messages), chunk_size):
+            chunk = messages[i:i + chunk_size]
+            self.executor.submit(process_chunk, _group_by_level(
+                (_as_level(level), message) for level, message in chunk))
+
+    @lru_cache(maxsize=32)
+    def get_logger(self, name: str) -> "logger":
+        """Get cached logger instance."""
+        return logger.bind(context=name)
+
+    async def alog(self, level: str, message: str):
+        """Enhanced async logging with stats."""
+        level = _as_level(level)
+        await logger.complete()
+        logger.log(level, message)
+        self.stats.update(level)
+
+
+# Create default logging configuration from settings
+log_config = LoggingConfig.from_settings()
+log = logger.bind(context=config.settings.app_name)
+
+# Example usage:
+if __name__ == "__main__":
+    # Enhanced progress bar example with theme
+    items = range(100)
+    progress = log_config.create_themed_progress(theme=ProgressTheme.NEON)
+
+    with progress:
+        task_id = progress.add_task("Processing", total=len(items))
+        with log_config.exception_group("item_processing"):
+            for item in items:
+                time.sleep(0.1)
+                progress.update(task_id, advance=1)
+
+    # Performance tracking example
+    with log_config.performance_tracking("heavy_operation"):
+        # Do some heavy work
+        time.sleep(2)
+
+    # Batch logging example
+    for i in range(1000):
+        log_config.batch_log("INFO", f"Batch log message {i}")
+    log_config.flush_logs()
+
+    # Parallel logging example
+    messages = [(LogLevel.INFO.value, f"Parallel message {i}")
+                for i in range(100)]
+    log_config.parallel_log(messages)
+
+    # Print statistics
+    stats = log_config.get_stats()
+    log_config.console.print(stats)
@@ -0,0 +1,39 @@
+"""YAML helpers shared by the test modules."""
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+except ImportError:  # libyaml not available
+    from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader
+
+__all__ = ["LOG_DIR_PLACEHOLDER", "YamlDumper", "YamlLoader", "dump_yaml",
+           "write_config", "yaml_bytes"]
+
+# Plain scalar standing in for a per-test log_dir in serialized configs
+LOG_DIR_PLACEHOLDER = "__LOGDIR__"
+
+
+def yaml_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize data as block-style YAML, keeping key order."""
+    return yaml.dump(data, Dumper=YamlDumper, sort_keys=False,
+                     default_flow_style=False, encoding="utf-8")
+
+
+def dump_yaml(data: Dict[str, Any], path: Path) -> None:
+    """Write data to a YAML file as block-style YAML, keeping key order."""
+    path.write_bytes(yaml_bytes(data))
+
+
+def write_config(template: bytes, path: Path, log_dir: Path) -> Path:
+    """Write a serialized config, filling in its ``LOG_DIR_PLACEHOLDER``.
+
+    The directory is substituted as a JSON string, which is also a YAML
+    double-quoted scalar, so any character in the path is escaped.
+    """
+    path.write_bytes(template.replace(LOG_DIR_PLACEHOLDER.encode(),
+                                      json.dumps(str(log_dir)).encode()))
+    return path
@@ -0,0 +1,18 @@
+"""Fixtures shared by the test suite."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from python_check_updates.config import _load_settings
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch) -> Path:
+    """Point settings snapshots at an empty directory, with a cold cache."""
+    tempdir = tmp_path / "tmp"
+    tempdir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(tempdir))
+    _load_settings.cache_clear()
+    yield tempdir / "python-check-updates"
+    _load_settings.cache_clear()
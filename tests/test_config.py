@@ -1,65 +1,116 @@
+import copy
+import importlib
+import json
 import os
+import pickle
+import time
 from pathlib import Path
 import pytest
 import yaml
 from typing import Dict, Any
+from unittest.mock import patch
 
-from python-check-updates.config import (
+from python_check_updates.config import (
     Config, 
     AppSettings,
     LoggingSettings,
     FrozenModel,
-    config
+    SNAPSHOT_MAX_AGE,
+    _load_settings,
+    _prune_snapshots,
+    config,
+    load_settings,
+    write_json_sidecar
 )
-from python-check-updates.logging import LogLevel
+from python_check_updates.logging import LogLevel
+
+from ._yaml import (LOG_DIR_PLACEHOLDER, YamlLoader, dump_yaml,
+                    write_config, yaml_bytes)
+
+# Canonical test config; log_dir is set per test
+_CONFIG_DICT: Dict[str, Any] = {
+    "app_name": "test_app",
+    "version": "0.1.0",
+    "debug": False,
+    "logging": {
+        "app_name": "test_app",
+        "level": "INFO",
+        "log_dir": "logs",
+        "format_string": "<green>{time}</green> | {message}",
+        "console": {"enabled": True},
+        "file": {"enabled": True},
+        "json": {"enabled": True},
+        "batch": {"initial_size": 100},
+        "progress": {
+            "theme": "NEON",
+            "themes": {
+                "neon": {
+                    "bar_color": "cyan",
+                    "complete_style": {"color": "green", "bold": True},
+                    "progress_style": {"color": "white"},
+                    "spinner_style": {"color": "magenta"},
+                    "description_style": {"color": "yellow"}
+                }
+            }
+        },
+        "parallel": {"max_workers": 2}
+    }
+}
 
 # Fixtures
 
+# Serialized once; each test only fills in its own log_dir
+_CONFIG_BYTES = yaml_bytes({
+    **_CONFIG_DICT,
+    "logging": {**_CONFIG_DICT["logging"], "log_dir": LOG_DIR_PLACEHOLDER},
+})
+
+def _write_config(directory: Path) -> Path:
+    """Write the canonical test config into a directory."""
+    return write_config(_CONFIG_BYTES, directory / "config.yaml",
+                        directory / "logs")
+
+def _new_config(config_path: Path) -> Config:
+    """Build a fresh config instance loaded from a file."""
+    Config._instance = None
+    instance = Config()
+    instance._config_path = config_path
+    instance.load_config()
+    return instance
+
 @pytest.fixture
 def temp_config_file(tmp_path) -> Path:
     """Create a temporary valid config file."""
-    config_data = {
-        "app_name": "test_app",
-        "version": "0.1.0",
-        "debug": False,
-        "logging": {
-            "app_name": "test_app",
-            "level": "INFO",
-            "log_dir": str(tmp_path / "logs"),
-            "format_string": "<green>{time}</green> | {message}",
-            "console": {"enabled": True},
-            "file": {"enabled": True},
-            "json": {"enabled": True},
-            "batch": {"initial_size": 100},
-            "progress": {
-                "theme": "NEON",
-                "themes": {
-                    "neon": {
-                        "bar_color": "cyan",
-                        "complete_style": {"color": "green", "bold": True},
-                        "progress_style": {"color": "white"},
-                        "spinner_style": {"color": "magenta"},
-                        "description_style": {"color": "yellow"}
-                    }
-                }
-            },
-            "parallel": {"max_workers": 2}
-        }
-    }
-    config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(config_data, f)
-    return config_path
+    return _write_config(tmp_path)
 
 @pytest.fixture
 def config_instance(temp_config_file: Path) -> Config:
     """Get a fresh config instance with temporary file."""
+    return _new_config(temp_config_file)
+
+@pytest.fixture(scope="session")
+def shared_config(tmp_path_factory) -> Config:
+    """Get one config instance shared by tests that only read settings.
+
+    Tests that reload, mutate the environment, or otherwise change the
+    config must use ``config_instance`` instead.
+    """
+    instance = _new_config(_write_config(tmp_path_factory.mktemp("shared")))
+    # Detach from the singleton slot so Config() elsewhere can't alter it
     Config._instance = None
-    instance = Config()
-    instance._config_path = temp_config_file
-    instance.load_config()
     return instance
 
+@pytest.fixture(autouse=True)
+def _restore_config_singleton():
+    """Put back the Config singleton after each test.
+
+    Under pytest-xdist the order in which a worker runs tests varies between
+    runs, so a test replacing the singleton must not leak it into the next.
+    """
+    instance = Config._instance
+    yield
+    Config._instance = instance
+
 # Test Cases
 
 def test_singleton_pattern():
@@ -68,15 +119,14 @@ def test_singleton_pattern():
     first = Config()
     second = Config()
     assert first is second
-    assert id(first) == id(second)
 
-def test_config_initialization(config_instance: Config):
+def test_config_initialization(shared_config: Config):
     """Test basic configuration initialization."""
-    assert config_instance._settings is not None
-    assert isinstance(config_instance._settings, AppSettings)
-    assert config_instance._settings.app_name == "test_app"
-    assert config_instance._settings.version == "0.1.0"
-    assert config_instance._settings.debug is False
+    assert shared_config._settings is not None
+    assert isinstance(shared_config._settings, AppSettings)
+    assert shared_config._settings.app_name == "test_app"
+    assert shared_config._settings.version == "0.1.0"
+    assert shared_config._settings.debug is False
 
 def test_yaml_loading(config_instance: Config, temp_config_file: Path):
     """Test YAML configuration loading."""
@@ -85,19 +135,42 @@ def test_yaml_loading(config_instance: Config, temp_config_file: Path):
     assert config_instance._settings.logging.level == LogLevel.INFO
     assert Path(config_instance._settings.logging.log_dir).name == "logs"
 
-def test_env_var_override(config_instance: Config):
+def test_env_var_override(config_instance: Config, monkeypatch):
     """Test environment variable overrides."""
-    os.environ["APP_DEBUG"] = "true"
-    os.environ["APP_LOGGING__LEVEL"] = "DEBUG"
+    monkeypatch.setenv("APP_DEBUG", "true")
+    monkeypatch.setenv("APP_LOGGING__LEVEL", "DEBUG")
     
     config_instance.reload()
     
     assert config_instance.settings.debug is True
     assert config_instance.settings.logging.level == LogLevel.DEBUG
-    
-    # Cleanup
-    del os.environ["APP_DEBUG"]
-    del os.environ["APP_LOGGING__LEVEL"]
+
+def test_env_var_override_nested_section(config_instance: Config, monkeypatch):
+    """Test environment overrides reach keys inside config sections."""
+    monkeypatch.setenv("APP_LOGGING__CONSOLE__ENABLED", "false")
+
+    config_instance.reload()
+
+    assert config_instance.settings.logging.console["enabled"] is False
+    assert config_instance.get_setting("logging.console.enabled") is False
+
+def test_env_var_override_keys_apply_over_section(config_instance: Config,
+                                                  monkeypatch):
+    """Test per-key overrides win over an override of their whole section."""
+    monkeypatch.setenv("APP_LOGGING__CONSOLE__ENABLED", "false")
+    monkeypatch.setenv("APP_LOGGING__CONSOLE", '{"enabled": true}')
+
+    config_instance.reload()
+
+    assert config_instance.settings.logging.console["enabled"] is False
+
+def test_env_var_override_invalid_json_names_variable(config_instance: Config,
+                                                      monkeypatch):
+    """Test a malformed section override reports which variable is wrong."""
+    monkeypatch.setenv("APP_LOGGING__CONSOLE", "{not json")
+
+    with pytest.raises(ValueError, match="APP_LOGGING__CONSOLE"):
+        config_instance.reload()
 
 def test_settings_cache(config_instance: Config):
     """Test settings caching behavior."""
@@ -117,40 +190,46 @@ def test_settings_cache(config_instance: Config):
     "",
     None
 ])
-def test_invalid_setting_paths(config_instance: Config, invalid_path):
+def test_invalid_setting_paths(shared_config: Config, invalid_path):
     """Test handling of invalid setting paths."""
-    assert config_instance.get_setting(invalid_path, default="default") == "default"
+    assert shared_config.get_setting(invalid_path, default="default") == "default"
 
 def test_config_reload(config_instance: Config, temp_config_file: Path):
     """Test configuration reloading."""
     original_level = config_instance.settings.logging.level
     
     # Modify config file
-    with open(temp_config_file) as f:
-        config_data = yaml.safe_load(f)
+    with open(temp_config_file, "rb") as f:
+        config_data = yaml.load(f, Loader=YamlLoader)
     config_data["logging"]["level"] = "DEBUG"
-    with open(temp_config_file, "w") as f:
-        yaml.dump(config_data, f)
+    dump_yaml(config_data, temp_config_file)
     
     config_instance.reload()
     assert config_instance.settings.logging.level == LogLevel.DEBUG
     assert config_instance.settings.logging.level != original_level
 
-def test_missing_config_file():
+def test_unchanged_reload_stats_each_file_once(config_instance: Config):
+    """Test an unchanged reload stats the config and sidecar, nothing else."""
+    with patch.object(os, "stat", wraps=os.stat) as stat, \
+            patch.object(Path, "resolve", side_effect=AssertionError):
+        config_instance.load_config()
+    assert stat.call_count == 2
+
+def test_missing_config_file(config_instance: Config):
     """Test handling of missing config file."""
-    config = Config()
+    config = config_instance
     config._config_path = Path("nonexistent.yaml")
     
     with pytest.raises(FileNotFoundError):
         config.load_config()
 
-def test_invalid_yaml_format(tmp_path):
+def test_invalid_yaml_format(tmp_path, config_instance: Config):
     """Test handling of invalid YAML format."""
     config_path = tmp_path / "invalid.yaml"
-    with open(config_path, "w") as f:
-        f.write("invalid: yaml: content: {")
+    with open(config_path, "wb") as f:
+        f.write(b"invalid: yaml: content: {")
     
-    config = Config()
+    config = config_instance
     config._config_path = config_path
     
     with pytest.raises(yaml.YAMLError):
@@ -165,16 +244,23 @@ def test_frozen_model_immutability():
     with pytest.raises(Exception):  # Pydantic raises TypeError or ValidationError
         model.value = "changed"
 
-def test_nested_settings_access(config_instance: Config):
+def test_nested_settings_access(shared_config: Config):
     """Test accessing nested settings."""
     # Valid nested access
-    assert config_instance.get_setting("logging.console.enabled") is True
+    assert shared_config.get_setting("logging.console.enabled") is True
     
     # Deep nesting
-    assert config_instance.get_setting("logging.progress.themes.neon.bar_color") == "cyan"
+    assert shared_config.get_setting("logging.progress.themes.neon.bar_color") == "cyan"
     
     # Invalid nesting with default
-    assert config_instance.get_setting("logging.invalid.nested.path", "default") == "default"
+    assert shared_config.get_setting("logging.invalid.nested.path", "default") == "default"
+
+def test_leaf_attribute_access(shared_config: Config):
+    """Test paths reaching past a leaf resolve attributes of its value."""
+    assert shared_config.get_setting("logging.log_dir.name") == "logs"
+    assert shared_config.get_setting("logging.level.value") == "INFO"
+    assert shared_config.get_setting("logging.log_dir.invalid", "default") == "default"
+    assert shared_config.get_setting("logging.console.invalid", "default") == "default"
 
 @pytest.mark.parametrize("setting_path,expected_type", [
     ("app_name", str),
@@ -183,9 +269,9 @@ def test_nested_settings_access(config_instance: Config):
     ("logging.level", LogLevel),
     ("logging.parallel.max_workers", int)
 ])
-def test_setting_types(config_instance: Config, setting_path: str, expected_type: type):
+def test_setting_types(shared_config: Config, setting_path: str, expected_type: type):
     """Test setting value types are correct."""
-    value = config_instance.get_setting(setting_path)
+    value = shared_config.get_setting(setting_path)
     assert isinstance(value, expected_type)
 
 def test_multiple_reloads(config_instance: Config):
@@ -198,15 +284,14 @@ def test_multiple_reloads(config_instance: Config):
 def test_concurrent_access(config_instance: Config):
     """Test concurrent access to settings."""
     import threading
-    import queue
     
-    results = queue.Queue()
+    results = []  # list.append is atomic, no queue locking needed
     def worker():
         try:
             value = config_instance.get_setting("logging.level")
-            results.put(("success", value))
+            results.append(("success", value))
         except Exception as e:
-            results.put(("error", str(e)))
+            results.append(("error", str(e)))
     
     threads = [threading.Thread(target=worker) for _ in range(10)]
     for t in threads:
@@ -214,36 +299,167 @@ def test_concurrent_access(config_instance: Config):
     for t in threads:
         t.join()
     
-    while not results.empty():
-        status, value = results.get()
+    assert len(results) == len(threads)
+    for status, value in results:
         assert status == "success"
         assert value == LogLevel.INFO
 
 def test_large_config(tmp_path):
     """Test handling of large configuration files."""
-    large_config = {
-        "app_name": "test_app",
-        "version": "0.1.0",
-        "logging": {
-            "level": "INFO",
-            "large_data": ["item" + str(i) for i in range(10000)]
-        }
-    }
+    large_config = copy.deepcopy(_CONFIG_DICT)
+    large_config["logging"]["log_dir"] = str(tmp_path / "logs")
+    large_config["logging"]["parallel"]["large_data"] = [
+        "item" + str(i) for i in range(10000)]
     
     config_path = tmp_path / "large_config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(large_config, f)
+    dump_yaml(large_config, config_path)
     
-    config = Config()
-    config._config_path = config_path
-    config.load_config()
+    config = _new_config(config_path)
     
-    assert len(config.get_setting("logging.large_data")) == 10000
+    assert len(config.get_setting("logging.parallel.large_data")) == 10000
+
+def _write_level(directory: Path, level: str) -> Path:
+    """Write the canonical config into a directory with a given log level."""
+    directory.mkdir(parents=True, exist_ok=True)
+    data = copy.deepcopy(_CONFIG_DICT)
+    data["logging"]["level"] = level
+    data["logging"]["log_dir"] = str(directory / "logs")
+    config_path = directory / "config.yaml"
+    dump_yaml(data, config_path)
+    return config_path
+
+def test_settings_cache_keyed_by_resolved_path(tmp_path, snapshot_dir, monkeypatch):
+    """Test same-named files with equal size and mtime never share settings."""
+    first = _write_level(tmp_path / "a", "DEBUG")
+    second = _write_level(tmp_path / "b", "ERROR")
+    stat = first.stat()
+    os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert second.stat().st_size == stat.st_size
+
+    monkeypatch.chdir(first.parent)
+    assert load_settings("config.yaml").logging.level == LogLevel.DEBUG
+    monkeypatch.chdir(second.parent)
+    assert load_settings("config.yaml").logging.level == LogLevel.ERROR
+
+def test_from_dict_validates_every_call():
+    """Test from_dict is not cached on its input and accepts plain dicts."""
+    data = copy.deepcopy(_CONFIG_DICT)
+    data["logging"]["log_dir"] = "logs"
+    first = AppSettings.from_dict(data)
+    data["logging"]["level"] = "DEBUG"
+    second = AppSettings.from_dict(data)
+    assert first.logging.level == LogLevel.INFO
+    assert second.logging.level == LogLevel.DEBUG
+
+def test_settings_cached_per_file_version(tmp_path, snapshot_dir):
+    """Test a file's settings are reused until the file changes."""
+    config_path = _write_level(tmp_path, "DEBUG")
+    first = load_settings(config_path)
+    assert load_settings(config_path) is first
+
+    _write_level(tmp_path, "WARNING")
+    second = load_settings(config_path)
+    assert second is not first
+    assert second.logging.level == LogLevel.WARNING
+
+def test_settings_snapshot_hit_skips_validation(temp_config_file, snapshot_dir):
+    """Test a new process reuses the validated snapshot of an unchanged file."""
+    settings = load_settings(temp_config_file)
+    assert len(list(snapshot_dir.glob("*.pkl"))) == 1
+
+    _load_settings.cache_clear()  # As in a fresh process
+    with patch.object(AppSettings, "from_dict", side_effect=AssertionError):
+        assert load_settings(temp_config_file).model_dump() == settings.model_dump()
+
+def test_settings_snapshot_mismatch_is_validated(temp_config_file, snapshot_dir):
+    """Test a snapshot not written for this file's content is not trusted."""
+    settings = load_settings(temp_config_file)
+    (cache_file,) = snapshot_dir.glob("*.pkl")
+    bogus = settings.model_dump()
+    bogus["logging"]["level"] = "not-a-level"
+    cache_file.write_bytes(bytes(64) + pickle.dumps(bogus))
+
+    _load_settings.cache_clear()
+    with patch.object(AppSettings, "from_dict",
+                      wraps=AppSettings.from_dict) as from_dict, \
+            patch.object(pickle, "load", side_effect=AssertionError):
+        assert load_settings(temp_config_file).logging.level == LogLevel.INFO
+    from_dict.assert_called_once()
+
+def test_stale_snapshots_pruned_across_directory(temp_config_file, snapshot_dir):
+    """Test old snapshots of any config file are pruned once per process."""
+    snapshot_dir.mkdir(mode=0o700)
+    orphan = snapshot_dir / "pcu-0123456789abcdef-00.pkl"
+    fresh = snapshot_dir / "pcu-fedcba9876543210-00.pkl"
+    orphan.write_bytes(b"")
+    fresh.write_bytes(b"")
+    old = time.time() - SNAPSHOT_MAX_AGE - 60
+    os.utime(orphan, (old, old))
+
+    _prune_snapshots.cache_clear()
+    load_settings(temp_config_file)
+    assert not orphan.exists()
+    assert fresh.exists()
+
+def test_snapshot_dir_rejected_unless_private(temp_config_file, snapshot_dir):
+    """Test snapshots are neither read nor written in a shared directory."""
+    snapshot_dir.mkdir(mode=0o700)
+    snapshot_dir.chmod(0o755)
+    load_settings(temp_config_file)
+    assert not list(snapshot_dir.iterdir())
+
+def test_settings_snapshot_invalidated_by_content(tmp_path, snapshot_dir):
+    """Test rewriting a file invalidates its snapshot despite an equal stat."""
+    config_path = _write_level(tmp_path, "DEBUG")
+    stat = config_path.stat()
+    assert load_settings(config_path).logging.level == LogLevel.DEBUG
+
+    _write_level(tmp_path, "ERROR")
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    _load_settings.cache_clear()
+    assert load_settings(config_path).logging.level == LogLevel.ERROR
+    assert len(list(snapshot_dir.glob("*.pkl"))) == 1  # Stale one pruned
+
+def test_settings_snapshot_invalidated_by_schema(temp_config_file, snapshot_dir,
+                                                 monkeypatch):
+    """Test snapshots validated against another schema are not trusted."""
+    config_module = importlib.import_module("python_check_updates.config")
+    load_settings(temp_config_file)
+
+    _load_settings.cache_clear()
+    monkeypatch.setattr(config_module, "_schema_fingerprint", lambda: b"changed")
+    with patch.object(AppSettings, "from_dict",
+                      wraps=AppSettings.from_dict) as from_dict:
+        load_settings(temp_config_file)
+    from_dict.assert_called_once()
+
+def test_json_sidecar_replaces_yaml(tmp_path, snapshot_dir):
+    """Test a compiled sidecar is loaded instead of the YAML, edits included."""
+    config_path = _write_level(tmp_path, "DEBUG")
+    sidecar = write_json_sidecar(config_path)
+    with patch.object(yaml, "load", side_effect=AssertionError):
+        assert load_settings(config_path).logging.level == LogLevel.DEBUG
+
+    payload = json.loads(sidecar.read_text())
+    payload["settings"]["logging"]["level"] = "WARNING"
+    sidecar.write_text(json.dumps(payload))
+    assert load_settings(config_path).logging.level == LogLevel.WARNING
+
+def test_json_sidecar_ignored_unless_compiled_from_yaml(tmp_path, snapshot_dir):
+    """Test unrelated or stale JSON next to the YAML is not trusted."""
+    config_path = _write_level(tmp_path, "DEBUG")
+    sidecar = config_path.with_suffix(".json")
+    sidecar.write_text(json.dumps({"logging": {"level": "ERROR"}}))
+    assert load_settings(config_path).logging.level == LogLevel.DEBUG
+
+    write_json_sidecar(config_path)
+    _write_level(tmp_path, "WARNING")
+    assert load_settings(config_path).logging.level == LogLevel.WARNING
 
-def test_config_performance(config_instance: Config, benchmark):
+def test_config_performance(shared_config: Config, benchmark):
     """Test configuration access performance."""
     def access_settings():
-        return config_instance.get_setting("logging.level")
+        return shared_config.get_setting("logging.level")
     
     result = benchmark(access_settings)
     assert result == LogLevel.INFO
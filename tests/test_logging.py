@@ -6,20 +6,26 @@ from unittest import mock
 import pytest
 from loguru import logger
 
-from python-check-updates.logging import LoggingConfig
+from python_check_updates.logging import LoggingConfig
 
 import asyncio
+import copy
 import json
 import os
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-import yaml
 from rich.progress import Progress
 
-from python-check-updates.logging import (LogLevel, LogStats, LoggingConfig,
-                                                 ProgressBarStyle, ProgressTheme)
+from python_check_updates.logging import (BufferedFileSink, JsonSink, LogLevel,
+                                          LogStats, LoggingConfig,
+                                          ProgressBarStyle, ProgressStyle,
+                                          ProgressTheme, _json_record,
+                                          _stdlib_dumps, get_executor)
+
+from ._yaml import (LOG_DIR_PLACEHOLDER, dump_yaml, write_config,
+                    yaml_bytes)
 
 """Test suite for logging configuration and functionality.
 
@@ -33,13 +39,52 @@ This module tests all aspects of the logging system:
 - Resource cleanup
 """
 
+# Canonical test config; log_dir is set per test
+_CONFIG_DICT = {
+    "logging": {
+        "app_name": "test_app",
+        "level": "INFO",
+        "log_dir": "logs",
+        "console": {"enabled": True},
+        "file": {"enabled": True},
+        "json": {"enabled": True},
+        "batch": {"initial_size": 100},
+        "progress": {
+            "theme": "NEON",
+            "themes": {
+                "neon": {
+                    "bar_color": "bright_cyan",
+                    "complete_style": {"color": "bright_green", "bold": True},
+                    "progress_style": {"color": "bright_white"},
+                    "spinner_style": {"color": "bright_magenta"},
+                    "description_style": {"color": "bright_yellow"}
+                },
+                "minimal": {
+                    "bar_color": "white",
+                    "complete_style": {"color": "grey70"},
+                    "progress_style": {"color": "grey50"},
+                    "spinner_style": {"color": "grey85"},
+                    "description_style": {"color": "grey74"}
+                }
+            }
+        },
+        "parallel": {"max_workers": 2}
+    }
+}
+
+# Serialized once; each test only fills in its own log_dir
+_CONFIG_BYTES = yaml_bytes({
+    **_CONFIG_DICT,
+    "logging": {**_CONFIG_DICT["logging"], "log_dir": LOG_DIR_PLACEHOLDER},
+})
+
 # Fixtures
 @pytest.fixture
 def mock_config_path(tmp_path):
     """Create a temporary config file for testing.
     
-    Creates a minimal valid configuration file with all required
-    logging settings for testing purposes.
+    Writes the minimal valid configuration, with all required logging
+    settings, pointing its log directory at tmp_path.
     
     Args:
         tmp_path: Pytest fixture providing temporary directory
@@ -47,29 +92,7 @@ def mock_config_path(tmp_path):
     Returns:
         Path: Path to temporary config file
     """
-    config = {
-        "logging": {
-            "app_name": "test_app",
-            "level": "INFO",
-            "log_dir": str(tmp_path),
-            "console": {"enabled": True},
-            "file": {"enabled": True},
-            "json": {"enabled": True},
-            "batch": {"initial_size": 100},
-            "progress": {
-                "theme": "NEON",
-                "themes": {
-                    "neon": ProgressTheme.NEON,
-                    "minimal": ProgressTheme.MINIMAL
-                }
-            },
-            "parallel": {"max_workers": 2}
-        }
-    }
-    config_path = tmp_path / "config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(config, f)
-    return config_path
+    return write_config(_CONFIG_BYTES, tmp_path / "config.yaml", tmp_path)
 
 @pytest.fixture
 def logging_config(mock_config_path, tmp_path):
@@ -92,61 +115,207 @@ def test_logging_config_from_yaml(mock_config_path):
     assert config.app_name == "test_app"
     assert config.log_level == LogLevel.INFO
 
+def test_from_yaml_keys_relative_paths_by_directory(tmp_path, monkeypatch):
+    """Test the same relative path in two directories loads each file."""
+    paths = []
+    for name in ("app_a", "app_b"):
+        data = copy.deepcopy(_CONFIG_DICT)
+        data["logging"]["app_name"] = name
+        data["logging"]["log_dir"] = str(tmp_path / "logs")
+        config_path = tmp_path / name / "config.yaml"
+        config_path.parent.mkdir()
+        dump_yaml(data, config_path)
+        paths.append(config_path)
+    stat = paths[0].stat()
+    os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    for config_path in paths:
+        monkeypatch.chdir(config_path.parent)
+        config = LoggingConfig.from_yaml("config.yaml")
+        assert config.app_name == config_path.parent.name
+
 # Logging Functionality Tests
-@pytest.mark.asyncio
-async def test_async_logging(logging_config):
+def test_async_logging(logging_config):
     """Test async logging capabilities."""
-    with patch("loguru.logger") as mock_logger:
+    logging_module = importlib.import_module("python_check_updates.logging")
+    with patch.object(logging_module, "logger") as mock_logger:
         mock_logger.complete = AsyncMock()
-        await logging_config.alog("INFO", "test message")
+        asyncio.run(logging_config.alog("INFO", "test message"))
         mock_logger.complete.assert_awaited_once()
         mock_logger.log.assert_called_once_with("INFO", "test message")
 
 def test_batch_logging(logging_config):
     """Test batch logging functionality."""
-    with patch("loguru.logger") as mock_logger:
+    logging_module = importlib.import_module("python_check_updates.logging")
+    with patch.object(logging_module, "logger") as mock_logger:
         # Test batch accumulation
         for i in range(50):
             logging_config.batch_log("INFO", f"msg {i}")
         assert len(logging_config._log_batch) == 50
-        mock_logger.log.assert_not_called()
+        mock_logger.opt.assert_not_called()
 
-        # Test batch flush
+        # Filling the batch drains it; the next message starts a new one
         for i in range(51):
             logging_config.batch_log("INFO", f"msg {i}")
+        assert len(logging_config._log_batch) == 1
+        emit = mock_logger.opt.return_value.bind.return_value.log
+        emit.assert_called_once()
+
+        # Test batch flush
+        logging_config.flush_logs()
         assert len(logging_config._log_batch) == 0
-        assert mock_logger.log.call_count > 0
+        assert emit.call_count == 2
+
+def test_batch_logging_rejects_unknown_level(logging_config):
+    """Test invalid levels fail when batched, not when flushed."""
+    with pytest.raises(ValueError):
+        logging_config.batch_log("VERBOSE", "msg")
+    assert len(logging_config._log_batch) == 0
+
+def test_cpu_sampler_shared_across_instances(logging_config, mock_config_path):
+    """Test instances share one CPU sampler thread instead of starting their own."""
+    import threading
+
+    LoggingConfig.from_yaml(mock_config_path)
+    samplers = [thread for thread in threading.enumerate()
+                if thread.name == "log-cpu-sampler"]
+    assert len(samplers) == 1
+
+def test_batch_size_adapts_once_per_cpu_sample(logging_config, monkeypatch):
+    """Test a high load sample halves the batch size once, not per drain."""
+    sampler = importlib.import_module("python_check_updates.logging")._CpuSampler
+    monkeypatch.setattr(sampler, "load", 100.0)
+    monkeypatch.setattr(sampler, "samples", sampler.samples + 1)
+    size = logging_config._adaptive_batch_size
+
+    logging_config._adjust_batch_size()
+    logging_config._adjust_batch_size()
+    assert logging_config._adaptive_batch_size == max(
+        logging_config._batch_settings["min_size"], size // 2)
+
+def test_executor_shared_across_instances(logging_config, mock_config_path):
+    """Test every instance submits work to the one process-wide executor."""
+    other = LoggingConfig.from_yaml(mock_config_path)
+    assert other.executor is logging_config.executor
+    assert logging_config.executor is get_executor()
+
+def test_temporary_level_filters_current_context(logging_config):
+    """Test temporary_level drops lower records only in its own context."""
+    import threading
+
+    messages = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]),
+                         level="DEBUG", filter=logging_config._log_filter)
+    try:
+        with logging_config.temporary_level("WARNING"):
+            logger.info("dropped")
+            other = threading.Thread(target=logger.info, args=("other thread",))
+            other.start()
+            other.join()
+            logger.warning("kept")
+        logger.info("restored")
+    finally:
+        logger.remove(sink_id)
+
+    assert messages == ["other thread", "kept", "restored"]
 
 # Progress Bar Tests
 def test_progress_bar_features(logging_config):
     """Test progress bar creation and updates."""
-    with patch("rich.progress.Progress") as MockProgress:
+    with patch.object(logging_config, "progress") as mock_progress:
         # Test creation
         task_id = logging_config.create_progress_bar(100, "test")
-        MockProgress.return_value.add_task.assert_called_once()
+        mock_progress.add_task.assert_called_once()
 
         # Test update
         logging_config.update_progress(task_id, 5)
-        MockProgress.return_value.update.assert_called_once()
+        mock_progress.update.assert_called_once_with(task_id, advance=5)
 
         # Test themed progress
         progress = logging_config.create_themed_progress(ProgressTheme.NEON)
         assert isinstance(progress, Progress)
 
+def test_themed_progress_by_name(logging_config):
+    """Test configured themes are resolved once and selectable by name."""
+    assert logging_config.themes["minimal"] == ProgressTheme.MINIMAL
+    assert logging_config.progress_style is logging_config.themes["neon"]
+    progress = logging_config.create_themed_progress("MINIMAL")
+    assert isinstance(progress, Progress)
+
+def test_progress_context_reuses_bar_per_description(logging_config):
+    """Test progress_context reports progress and reuses one bar per description."""
+    with logging_config.progress_context(10, "Copying") as reporter:
+        reporter.update(5)
+        progress = logging_config._progress_cache["Copying"]
+        assert progress.tasks[0].completed == 5
+        reporter.finish()
+    assert progress.task_ids == []
+
+    with logging_config.progress_context(3, "Copying"):
+        assert logging_config._progress_cache["Copying"] is progress
+
+def test_nested_progress_context_keeps_outer_bar_running(logging_config):
+    """Test an inner context with the same description gets its own bar."""
+    with logging_config.progress_context(10, "Copying") as outer:
+        progress = logging_config._progress_cache["Copying"]
+        with logging_config.progress_context(5, "Copying") as inner:
+            inner.update(5)
+        assert progress.live.is_started
+        outer.update(2)
+        assert progress.tasks[0].completed == 2
+    assert not progress.live.is_started
+
+def test_progress_style_from_config():
+    """Test theme config sections convert to the matching ProgressStyle."""
+    themes = _CONFIG_DICT["logging"]["progress"]["themes"]
+    assert ProgressStyle.from_config(themes["neon"]) == ProgressTheme.NEON
+    assert ProgressStyle.from_config(themes["minimal"]) == ProgressTheme.MINIMAL
+
+def test_log_config_from_shipped_config():
+    """Test a log config builds from the repository's own config.yaml."""
+    config_path = Path(__file__).resolve().parents[1] / "config.yaml"
+
+    with patch("rich.console.Console"):
+        log_config = LoggingConfig.from_yaml(config_path)
+
+    assert log_config.progress_style == ProgressTheme.NEON
+    assert log_config.themes["minimal"] == ProgressTheme.MINIMAL
+
 # Performance and Resource Tests
 def test_performance_tracking(logging_config):
-    """Test performance tracking functionality."""
+    """Test performance tracking reports peak RSS growth from getrusage."""
+    logging_module = importlib.import_module("python_check_updates.logging")
+    growth = 2 * 1024 * 1024 // logging_module._MAXRSS_BYTES
     with patch("time.perf_counter") as mock_time, \
-         patch("psutil.Process") as mock_process, \
-         patch("loguru.logger") as mock_logger:
+         patch.object(logging_module, "resource") as mock_resource, \
+         patch.object(logging_module, "logger") as mock_logger:
         
         mock_time.side_effect = [0, 1]
-        mock_process.return_value.memory_info.return_value.rss = 1024 * 1024
+        mock_resource.getrusage.side_effect = [
+            Mock(ru_maxrss=1024), Mock(ru_maxrss=1024 + growth)]
         
         with logging_config.performance_tracking("test_op"):
             pass
         
         mock_logger.info.assert_called_once()
+        assert "Duration: 1.00s" in mock_logger.info.call_args.args[0]
+        assert "Peak memory growth: 2.00MB" in mock_logger.info.call_args.args[0]
+
+def test_performance_tracking_without_resource(logging_config):
+    """Test performance tracking falls back to psutil without getrusage."""
+    logging_module = importlib.import_module("python_check_updates.logging")
+    with patch.object(logging_module, "resource", None), \
+         patch.object(logging_module, "_process") as mock_process, \
+         patch.object(logging_module, "logger") as mock_logger:
+        
+        mock_process.return_value.memory_info.side_effect = [
+            Mock(rss=1024 * 1024), Mock(rss=4 * 1024 * 1024)]
+        
+        with logging_config.performance_tracking("test_op"):
+            pass
+        
+        mock_process.assert_called_with(os.getpid())
+        assert "Peak memory growth: 3.00MB" in mock_logger.info.call_args.args[0]
 
 # Error Handling and Edge Cases
 @pytest.mark.parametrize("invalid_config", [
@@ -157,8 +326,7 @@ def test_performance_tracking(logging_config):
 def test_invalid_config_handling(tmp_path, invalid_config):
     """Test handling of invalid configurations."""
     config_path = tmp_path / "invalid_config.yaml"
-    with open(config_path, "w") as f:
-        yaml.dump(invalid_config, f)
+    dump_yaml(invalid_config, config_path)
     
     with pytest.raises((KeyError, ValueError)):
         LoggingConfig.from_yaml(config_path)
@@ -175,6 +343,130 @@ def test_log_interpolation_edge_cases(logging_config):
     # Empty message
     assert logging_config.interpolate("") == ""
 
+def test_json_sink_writes_json_lines(tmp_path):
+    """Test JSON sink serializes each record as one JSON line."""
+    from datetime import datetime
+
+    record = {
+        "time": datetime(2024, 1, 1, 12, 0, 0),
+        "level": Mock(name="level"),
+        "message": "hello",
+        "module": "mod",
+        "function": "func",
+        "line": 42,
+        "process": Mock(id=1),
+        "thread": Mock(id=2),
+        "extra": {"context": "test"},
+    }
+    record["level"].name = "INFO"
+    sink = JsonSink(tmp_path / "test.json", buffering=65536)
+    sink.write(Mock(record=record))
+    sink.write(Mock(record=record))
+    assert (tmp_path / "test.json").read_bytes() == b""  # Still buffered
+    sink.sync()
+
+    lines = (tmp_path / "test.json").read_bytes().splitlines()
+    sink.stop()
+    assert len(lines) == 2
+    data = json.loads(lines[0])
+    assert data["timestamp"] == "2024-01-01T12:00:00Z"
+    assert data["level"] == "INFO"
+    assert data["message"] == "hello"
+    assert data["process"] == 1
+    assert data["extra"] == {"context": "test"}
+
+def test_flush_logs_writes_records_to_disk(logging_config, tmp_path):
+    """Test flush_logs leaves no logged record in the file sinks' buffers."""
+    logger.info("durable")
+    logging_config.flush_logs()
+    assert b"durable" in (tmp_path / "test_app.log").read_bytes()
+    assert b"durable" in (tmp_path / "test_app.json").read_bytes()
+
+def test_batch_log_writes_one_json_line_per_message(logging_config, tmp_path):
+    """Test batched messages come back out of the JSON log one per line."""
+    for i in range(3):
+        logging_config.batch_log("INFO", f"b{i}")
+    logging_config.flush_logs()
+
+    lines = (tmp_path / "test_app.json").read_bytes().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["message"] for r in records] == ["b0", "b1", "b2"]
+    assert all(r["level"] == "INFO" for r in records)
+    assert all(r["function"] is None and "batch" not in r["extra"]
+               for r in records)
+    assert (tmp_path / "test_app.log").read_text().endswith("b0\nb1\nb2\n")
+
+def test_json_sink_writes_loguru_records(tmp_path):
+    """Test real loguru records get ISO 8601 timestamps in either serializer."""
+    from datetime import datetime
+
+    records = []
+    sink_ids = [logger.add(JsonSink(tmp_path / "test.json")),
+                logger.add(lambda message: records.append(message.record))]
+    try:
+        logger.info("hello")
+    finally:
+        for sink_id in sink_ids:
+            logger.remove(sink_id)
+
+    (line,) = (tmp_path / "test.json").read_bytes().splitlines()
+    data = json.loads(line)
+    assert data["message"] == "hello"
+    timestamp = datetime.fromisoformat(data["timestamp"])
+    assert timestamp == records[0]["time"]
+    assert line + b"\n" == _stdlib_dumps(_json_record(records[0]))
+
+def test_json_sink_rotates_compresses_and_prunes(tmp_path):
+    """Test the JSON sink honours the rotation, compression and retention keys."""
+    import zipfile
+
+    expired = tmp_path / "app.2000-01-01_00-00-00_000000.json.zip"
+    expired.touch()
+    os.utime(expired, (0, 0))
+    sink_id = logger.add(JsonSink(tmp_path / "app.json", rotation_size="300 B",
+                                  compression="zip", retention_days=7))
+    try:
+        for i in range(5):
+            logger.info(f"msg {i}")
+    finally:
+        logger.remove(sink_id)
+
+    assert not expired.exists()
+    archives = sorted(tmp_path.glob("app.*.json.zip"))
+    assert archives
+    lines = []
+    for archive in archives:
+        with zipfile.ZipFile(archive) as zipped:
+            (name,) = zipped.namelist()
+            lines += zipped.read(name).splitlines()
+    lines += (tmp_path / "app.json").read_bytes().splitlines()
+    assert [json.loads(line)["message"] for line in lines] == [
+        f"msg {i}" for i in range(5)]
+
+def test_json_sink_rejects_unsupported_compression(tmp_path):
+    """Test unknown compression formats fail when the sink is created."""
+    with pytest.raises(ValueError):
+        JsonSink(tmp_path / "app.json", compression="rar")
+
+def test_stdlib_json_fallback_matches_orjson_format():
+    """Test the stdlib serializer used without orjson emits the same lines."""
+    from datetime import datetime, timedelta, timezone
+
+    line = _stdlib_dumps({
+        "naive": datetime(2024, 1, 1, 12, 0, 0),
+        "utc": datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc),
+        "offset": datetime(2024, 1, 1, 12, 0, 0,
+                           tzinfo=timezone(timedelta(hours=2))),
+        "path": Path("logs"),
+    })
+    assert line.endswith(b"\n")
+    assert json.loads(line) == {
+        "naive": "2024-01-01T12:00:00Z",
+        "utc": "2024-01-01T12:00:00Z",
+        "offset": "2024-01-01T12:00:00+02:00",
+        "path": "logs",
+    }
+
 # Statistics and Metrics Tests
 def test_logging_statistics(logging_config):
     """Test logging statistics collection and accuracy.
@@ -198,6 +490,25 @@ def test_logging_statistics(logging_config):
     assert "messages_per_second" in stats
 
 # Thread Safety Tests
+def test_log_stats_concurrent_updates_are_exact():
+    """Test counts from many threads updating at once are not lost."""
+    import threading
+
+    stats = LogStats()
+
+    def update():
+        for _ in range(10000):
+            stats.update(LogLevel.ERROR, is_error=True)
+
+    threads = [threading.Thread(target=update) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stats.total_messages == stats.errors_count == 80000
+    assert stats.by_level() == {"ERROR": 80000}
+
 def test_thread_safety(logging_config):
     """Test thread-safe operations."""
     import threading
@@ -218,10 +529,12 @@ def test_thread_safety(logging_config):
 # Cleanup and Resource Management
 def test_resource_cleanup(logging_config):
     """Test proper resource cleanup."""
-    with patch("loguru.logger") as mock_logger:
+    logging_module = importlib.import_module("python_check_updates.logging")
+    with patch.object(logging_module, "logger") as mock_logger:
+        logging_config.batch_log("INFO", "pending")
         logging_config.flush_logs()
-        del logging_config
-        mock_logger.remove.assert_called()
+        assert len(logging_config._log_batch) == 0
+        mock_logger.complete.assert_called_once()
 
 # Integration Tests
 def test_full_logging_workflow(logging_config, tmp_path):
@@ -238,9 +551,9 @@ def test_full_logging_workflow(logging_config, tmp_path):
         asyncio.run(logging_config.alog("DEBUG", "async message"))
         
         # Progress tracking
-        with logging_config.progress_context(10, "test") as task_id:
+        with logging_config.progress_context(10, "test") as reporter:
             for _ in range(10):
-                logging_config.update_progress(task_id)
+                reporter.update()
         
         # Performance tracking
         with logging_config.performance_tracking("test"):
@@ -251,14 +564,13 @@ def test_full_logging_workflow(logging_config, tmp_path):
         assert stats["total_messages"] > 0
 
 def test_logger_configuration():
-    with mock.patch('rich.logging.RichHandler') as MockRichHandler, \
-         mock.patch('rich.console.Console') as MockConsole, \
+    logging_module = importlib.import_module('python_check_updates.logging')
+    with mock.patch.object(logging_module, 'RichHandler') as MockRichHandler, \
          mock.patch('loguru.logger.add') as MockLoggerAdd, \
          mock.patch('loguru.logger.remove') as MockLoggerRemove:
 
-        # Re-import the logger module to trigger the configuration
-        importlib.reload(
-            importlib.import_module('python-check-updates.logging'))
+        # Re-apply the default configuration's sinks
+        logging_module.log_config.reconfigure_sinks()
 
         # Check if logger.remove was called
         MockLoggerRemove.assert_called_once()
@@ -277,11 +589,14 @@ def test_logger_configuration():
         assert console_call_args[1]['format'] == LoggingConfig.DEFAULT_FORMAT
 
         # Verify file logger configuration
-        assert file_call_args[1]['sink'] == "logs/python-check-updates.log"
+        assert type(file_call_args[1]['sink']) is BufferedFileSink
+        assert file_call_args[1]['sink'].path == Path("logs/python-check-updates.log")
         assert file_call_args[1]['level'] == "DEBUG"
         assert file_call_args[1]['format'] == LoggingConfig.DEFAULT_FORMAT
+        assert file_call_args[1]['enqueue'] is True
+        assert file_call_args[1]['sink']._buffering == 8192
 
         # Verify structured file logger configuration
-        assert structured_file_call_args[1]['sink'] == "logs/python-check-updates.json"
+        assert isinstance(structured_file_call_args[1]['sink'], JsonSink)
+        assert structured_file_call_args[1]['sink'].path == Path("logs/python-check-updates.json")
         assert structured_file_call_args[1]['level'] == "DEBUG"
-        assert structured_file_call_args[1]['format'] == LoggingConfig.DEFAULT_FORMAT